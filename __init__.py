@@ -13,23 +13,23 @@ Architecture (v3.0 - Onion Architecture):
 
 __version__ = "3.0.0"
 
-# Re-export plugin class
-# Re-export application layer
-from .application import ClaudeExecutor
+import importlib
+from typing import TYPE_CHECKING
 
-# Re-export infrastructure components
-from .infrastructure import (
-    ChunkParser,
-    CommandBuilder,
-    ConfigValidator,
-    ConfigWriter,
-    OutputParser,
-    PathResolver,
-    ProcessRunner,
-    StreamProcessor,
-    validate_config,
-)
-from .main import ClaudeCodePlugin
+if TYPE_CHECKING:
+    from .application import ClaudeExecutor
+    from .infrastructure import (
+        ChunkParser,
+        CommandBuilder,
+        ConfigValidator,
+        ConfigWriter,
+        OutputParser,
+        PathResolver,
+        ProcessRunner,
+        StreamProcessor,
+        validate_config,
+    )
+    from .main import ClaudeCodePlugin
 
 # Re-export types for backward compatibility
 from .models import (
@@ -63,6 +63,34 @@ from .utils import (
     with_timeout,
 )
 
+# Plugin, application and infrastructure re-exports are resolved on first
+# access, so importing the package (or main) does not load the executor graph.
+# Exported name -> defining module
+_LAZY_EXPORTS = {
+    "ClaudeCodePlugin": ".main",
+    "ClaudeExecutor": ".application",
+    "CommandBuilder": ".infrastructure.process",
+    "ProcessRunner": ".infrastructure.process",
+    "OutputParser": ".infrastructure.process",
+    "ChunkParser": ".infrastructure.stream",
+    "StreamProcessor": ".infrastructure.stream",
+    "PathResolver": ".infrastructure.config",
+    "ConfigValidator": ".infrastructure.config",
+    "ConfigWriter": ".infrastructure.config",
+    "validate_config": ".infrastructure.config",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Version
     "__version__",
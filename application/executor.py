@@ -16,6 +16,7 @@ from ..models import (
     Result,
     err,
 )
+from ..utils import ensure_dir
 
 if TYPE_CHECKING:
     from ..claude_config import ClaudeConfigManager
@@ -23,6 +24,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger("astrbot")
 
 
+def _task_preview(task: str, max_len: int = 50) -> str:
+    return task[:max_len] + "..." if len(task) > max_len else task
+
+
 class ClaudeExecutor:
     """
     Claude Code CLI executor facade.
@@ -45,7 +50,7 @@ class ClaudeExecutor:
     ):
         self.workspace = workspace
         self.config_manager = config_manager
-        self.workspace.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.workspace)
 
         self._command_builder = command_builder or CommandBuilder()
         self._process_runner = process_runner or ProcessRunner()
@@ -88,8 +93,7 @@ class ClaudeExecutor:
         task: str,
         timeout: int | None = None,
     ) -> Result[ExecutionResult, ExecutionError]:
-        task_preview = task[:50] + "..." if len(task) > 50 else task
-        logger.info(f"[ClaudeExecutor] execute_typed task={task_preview}")
+        logger.info("[ClaudeExecutor] execute_typed task=%.50s", task)
         start_time = time.time()
 
         timeout = self._resolve_timeout(timeout)
@@ -135,7 +139,7 @@ class ClaudeExecutor:
                 ExecutionError(
                     code=ErrorCode.TIMEOUT,
                     message=f"Task execution exceeded {timeout}s timeout",
-                    details={"task_preview": task_preview, "timeout": timeout},
+                    details={"task_preview": _task_preview(task), "timeout": timeout},
                 )
             )
 
@@ -165,8 +169,7 @@ class ClaudeExecutor:
         timeout: int | None = None,
         on_progress: ProgressCallback | None = None,
     ) -> Result[ExecutionResult, ExecutionError]:
-        task_preview = task[:50] + "..." if len(task) > 50 else task
-        logger.info(f"[ClaudeExecutor] execute_stream task={task_preview}")
+        logger.info("[ClaudeExecutor] execute_stream task=%.50s", task)
         start_time = time.time()
 
         timeout = self._resolve_timeout(timeout)
@@ -220,7 +223,7 @@ class ClaudeExecutor:
                 ExecutionError(
                     code=ErrorCode.TIMEOUT,
                     message=f"Task execution exceeded {timeout}s timeout",
-                    details={"task_preview": task_preview, "timeout": timeout},
+                    details={"task_preview": _task_preview(task), "timeout": timeout},
                 )
             )
 
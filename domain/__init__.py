@@ -8,6 +8,7 @@ from .errors import (
     DomainError,
     ErrorCode,
     ExecutionError,
+    FrozenMap,
     IOError,
     ValidationError,
 )
@@ -36,4 +37,5 @@ __all__ = [
     "ExecutionError",
     "IOError",
     "ErrorCode",
+    "FrozenMap",
 ]
@@ -1,17 +1,64 @@
 """
 Domain Errors - Structured error types for the domain layer.
 
-These are extracted from types.py to maintain separation of concerns.
-The original types.py is preserved for backward compatibility.
+This is the single definition of the error types; models.py re-exports
+them for backward compatibility.
 """
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 
+class FrozenMap(Mapping):
+    """
+    Read-only mapping that can be shared between instances.
+
+    Unlike types.MappingProxyType it pickles and deep-copies (as a new
+    FrozenMap), so dataclasses holding one stay serializable.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any] = ()) -> None:
+        self._data = dict(data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"FrozenMap({self._data!r})"
+
+    def __reduce__(self):
+        return (FrozenMap, (self._data,))
+
+
+# Shared read-only mapping for omitted metadata/details (no per-instance dict)
+_EMPTY_MAP: Mapping[str, Any] = FrozenMap()
+
+
+def _empty_map() -> Mapping[str, Any]:
+    return _EMPTY_MAP
+
+
 class ErrorCode(str, Enum):
-    """Structured error codes for programmatic handling."""
+    """
+    Structured error codes for programmatic handling.
+
+    Members are singletons: compare with ``is`` (``code is ErrorCode.TIMEOUT``)
+    rather than ``==``, which goes through ``str.__eq__``. The ``str`` mixin is
+    kept so codes stay JSON-serializable and comparable to raw strings.
+    """
 
     TIMEOUT = "TIMEOUT"
     PARSE_ERROR = "PARSE_ERROR"
@@ -32,7 +79,7 @@ class DomainError(Exception):
         self.message = message
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """Configuration validation error."""
 
@@ -43,7 +90,7 @@ class ValidationError:
         return f"[{self.field}] {self.message}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecutionError:
     """
     Structured execution error.
@@ -51,18 +98,18 @@ class ExecutionError:
     Attributes:
         code: Error code for programmatic handling
         message: Human-readable error message
-        details: Additional context (stdout, stderr, etc.)
+        details: Additional context (stdout, stderr, etc.), read-only empty if omitted
     """
 
     code: ErrorCode
     message: str
-    details: dict[str, Any] = field(default_factory=dict)
+    details: Mapping[str, Any] = field(default_factory=_empty_map)
 
     def __str__(self) -> str:
         return f"[{self.code.value}] {self.message}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IOError:
     """File I/O operation error."""
 
@@ -75,6 +122,7 @@ class IOError:
 
 
 __all__ = [
+    "FrozenMap",
     "ErrorCode",
     "DomainError",
     "ValidationError",
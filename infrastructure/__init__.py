@@ -1,12 +1,45 @@
 """
 Infrastructure Layer - Concrete implementations of domain interfaces.
+
+Re-exports are resolved on first attribute access, so importing one
+subpackage (e.g. infrastructure.config) does not load the others.
 """
 
-from .config import ConfigValidator, ConfigWriter, PathResolver, validate_config
-from .http import ServerManager
-from .installer import CLIInstaller, MarketplaceManager
-from .process import CommandBuilder, OutputParser, ProcessRunner
-from .stream import ChunkParser, StreamProcessor
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import ConfigValidator, ConfigWriter, PathResolver, validate_config
+    from .http import ServerManager
+    from .installer import CLIInstaller, MarketplaceManager
+    from .process import CommandBuilder, OutputParser, ProcessRunner
+    from .stream import ChunkParser, StreamProcessor
+
+# Exported name -> defining subpackage
+_EXPORTS = {
+    "CommandBuilder": ".process",
+    "ProcessRunner": ".process",
+    "OutputParser": ".process",
+    "ChunkParser": ".stream",
+    "StreamProcessor": ".stream",
+    "PathResolver": ".config",
+    "ConfigValidator": ".config",
+    "ConfigWriter": ".config",
+    "validate_config": ".config",
+    "CLIInstaller": ".installer",
+    "MarketplaceManager": ".installer",
+    "ServerManager": ".http",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Process
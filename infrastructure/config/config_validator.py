@@ -16,6 +16,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("astrbot")
 
+# Public ordered tuple (indexable, stable in messages); private frozenset for lookups
+_PERMISSION_MODES: tuple[str, ...] = ("default", "acceptEdits", "plan", "dontAsk")
+_VALID_MODES: frozenset[str] = frozenset(_PERMISSION_MODES)
+_MIN_TIMEOUT = 10
+_MAX_TIMEOUT = 600
+
 
 class ConfigValidator:
     """
@@ -25,9 +31,9 @@ class ConfigValidator:
     Pure validation logic with no side effects.
     """
 
-    VALID_PERMISSION_MODES = ["default", "acceptEdits", "plan", "dontAsk"]
-    MIN_TIMEOUT = 10
-    MAX_TIMEOUT = 600
+    VALID_PERMISSION_MODES = _PERMISSION_MODES
+    MIN_TIMEOUT = _MIN_TIMEOUT
+    MAX_TIMEOUT = _MAX_TIMEOUT
 
     def validate(self, config: ClaudeConfig) -> Result[ClaudeConfig, ValidationError]:
         """
@@ -71,10 +77,10 @@ class ConfigValidator:
 
     def _validate_permission_mode(self, config: ClaudeConfig) -> ValidationError | None:
         """Validate permission mode."""
-        if config.permission_mode not in self.VALID_PERMISSION_MODES:
+        if config.permission_mode not in _VALID_MODES:
             error = ValidationError(
                 "permission_mode",
-                f"无效的权限模式: {config.permission_mode}, 有效值: {self.VALID_PERMISSION_MODES}",
+                f"无效的权限模式: {config.permission_mode}, 有效值: {list(_PERMISSION_MODES)}",
             )
             logger.warning(f"[ConfigValidator] {error}")
             return error
@@ -82,10 +88,10 @@ class ConfigValidator:
 
     def _validate_timeout(self, config: ClaudeConfig) -> ValidationError | None:
         """Validate timeout range."""
-        if config.timeout_seconds < self.MIN_TIMEOUT or config.timeout_seconds > self.MAX_TIMEOUT:
+        if not _MIN_TIMEOUT <= config.timeout_seconds <= _MAX_TIMEOUT:
             error = ValidationError(
                 "timeout_seconds",
-                f"超时时间应在{self.MIN_TIMEOUT}-{self.MAX_TIMEOUT}秒之间, 当前值: {config.timeout_seconds}",
+                f"超时时间应在{_MIN_TIMEOUT}-{_MAX_TIMEOUT}秒之间, 当前值: {config.timeout_seconds}",
             )
             logger.warning(f"[ConfigValidator] {error}")
             return error
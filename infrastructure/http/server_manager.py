@@ -56,8 +56,7 @@ class ServerManager:
             return True
 
         # Check if already running (cross-platform)
-        pattern = f"http.server {self.port}"
-        if await is_process_running(pattern):
+        if await is_process_running(self._process_pattern):
             logger.info(f"[ServerManager] Server already running on port {self.port}")
             return True
 
@@ -76,7 +75,7 @@ class ServerManager:
                 "0.0.0.0",
             ]
 
-            pid = await start_background_process(cmd, self.workspace)
+            pid = await start_background_process(cmd, self.workspace, key=self._process_pattern)
 
             if pid:
                 self._pid = pid
@@ -110,7 +109,7 @@ class ServerManager:
                 logger.warning(f"[ServerManager] Failed to stop: {e}")
                 return False
         if self._pid:
-            if terminate_process(self._pid):
+            if await terminate_process(self._pid):
                 logger.info("[ServerManager] Server stopped via PID")
                 self._pid = None
                 return True
@@ -118,6 +117,11 @@ class ServerManager:
             return False
         return True
 
+    @property
+    def _process_pattern(self) -> str:
+        """Command-line pattern identifying this server's process."""
+        return f"http.server {self.port}"
+
     def _is_port_in_use(self) -> bool:
         """Check if port is in use (local check)."""
         try:
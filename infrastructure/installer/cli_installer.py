@@ -7,6 +7,7 @@ Single responsibility: Install and manage Claude CLI.
 import asyncio
 import logging
 import shutil
+from typing import ClassVar
 
 from ...utils import resolve_command
 
@@ -22,6 +23,10 @@ class CLIInstaller:
 
     PACKAGE_NAME = "@anthropic-ai/claude-code"
 
+    # Process-wide: successful install check shared across plugin instances
+    _install_cache: ClassVar[tuple[bool, str] | None] = None
+    _install_lock: ClassVar[asyncio.Lock | None] = None
+
     def __init__(self):
         self.claude_path: str | None = None
 
@@ -42,7 +47,7 @@ class CLIInstaller:
                 self.claude_path,
                 "--version",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
             stdout, _ = await proc.communicate()
             return stdout.decode().strip()
@@ -89,7 +94,29 @@ class CLIInstaller:
             return False, f"Install error: {str(e)}"
 
     async def ensure_installed(self, auto_install: bool = True) -> tuple[bool, str]:
-        """Ensure Claude Code is installed."""
+        """
+        Ensure Claude Code is installed.
+
+        Concurrent callers are serialized so only one npm install runs, and a
+        successful result is cached for the process lifetime.
+        """
+        cls = type(self)
+        if cls._install_cache is not None:
+            return cls._install_cache
+
+        if cls._install_lock is None:
+            cls._install_lock = asyncio.Lock()
+
+        async with cls._install_lock:
+            if cls._install_cache is not None:
+                return cls._install_cache
+
+            result = await self._ensure_installed(auto_install)
+            if result[0]:
+                cls._install_cache = result
+            return result
+
+    async def _ensure_installed(self, auto_install: bool) -> tuple[bool, str]:
         if self.is_installed():
             version = await self.get_version()
             return True, f"Already installed: {version}"
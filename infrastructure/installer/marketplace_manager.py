@@ -48,7 +48,7 @@ class MarketplaceManager:
                 "marketplace",
                 "list",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
             stdout, _ = await proc.communicate()
             output = stdout.decode()
@@ -69,10 +69,11 @@ class MarketplaceManager:
                 "marketplace",
                 "add",
                 self.OFFICIAL_MARKETPLACE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                # Only the returncode is used
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
+            await asyncio.wait_for(proc.wait(), timeout=120)
             if proc.returncode == 0:
                 return True, "Marketplace added via claude command"
         except Exception as e:
@@ -102,10 +103,11 @@ class MarketplaceManager:
                     "1",
                     self.MARKETPLACE_HTTPS_URL,
                     str(target_dir),
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                    # Only the returncode is used
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
                 )
-                await asyncio.wait_for(proc.communicate(), timeout=120)
+                await asyncio.wait_for(proc.wait(), timeout=120)
                 if proc.returncode != 0:
                     return False, "Git clone failed"
             except Exception as e:
@@ -2,11 +2,12 @@
 Process Infrastructure - Subprocess execution components.
 """
 
-from .command_builder import CommandBuilder
+from .command_builder import BuiltCommand, CommandBuilder
 from .output_parser import OutputParser
 from .process_runner import ProcessRunner
 
 __all__ = [
+    "BuiltCommand",
     "CommandBuilder",
     "ProcessRunner",
     "OutputParser",
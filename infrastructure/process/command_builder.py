@@ -5,6 +5,7 @@ Single responsibility: Transform task + config into command arguments.
 No subprocess execution, no I/O - pure transformation.
 """
 
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -12,6 +13,32 @@ if TYPE_CHECKING:
     from ...models import ClaudeConfig
 
 
+class BuiltCommand(list):
+    """
+    Command argument list with a flag lookup view.
+
+    Behaves exactly like the argv list (indexing, iteration, unpacking);
+    ``flags`` maps each flag to the values that followed it, so repeated
+    flags such as ``--add-dir`` collect all their values.
+    """
+
+    __slots__ = ("flags",)
+
+    def __init__(self, argv: list[str], flags: dict[str, list[str]]):
+        super().__init__(argv)
+        self.flags = flags
+
+
+def _index_flags(args: tuple[str, ...], flags: dict[str, list[str]]) -> None:
+    """Fold ``--flag value...`` sequences from args into flags."""
+    values: list[str] | None = None
+    for arg in args:
+        if arg.startswith("--"):
+            values = flags.setdefault(arg, [])
+        elif values is not None:
+            values.append(arg)
+
+
 class CommandBuilder:
     """
     Builds Claude CLI command arguments.
@@ -20,13 +47,19 @@ class CommandBuilder:
     Pure function-like class: no side effects, deterministic output.
     """
 
+    # Bound on cached config-derived argument tuples per builder
+    MAX_CACHED_CONFIGS = 64
+
+    def __init__(self):
+        self._arg_cache: dict[tuple, tuple[str, ...]] = {}
+
     def build(
         self,
         task: str,
         workspace: Path,
         config: "ClaudeConfig",
         stream: bool = False,
-    ) -> list[str]:
+    ) -> BuiltCommand:
         """
         Build command arguments for Claude CLI.
 
@@ -37,28 +70,59 @@ class CommandBuilder:
             stream: Whether to use streaming output
 
         Returns:
-            List of command arguments
+            BuiltCommand (argument list with a ``flags`` view)
         """
         output_format = "stream-json" if stream else "json"
+        # Config-based arguments (cached per workspace + config values)
+        config_args = self._config_args(config, workspace)
+
         cmd_args = [
             "claude",
             "-p",
             task,
             "--output-format",
             output_format,
+            # stream-json requires --verbose when using -p
+            *(("--verbose",) if stream else ()),
+            *config_args,
         ]
 
-        # stream-json requires --verbose when using -p
+        flags: dict[str, list[str]] = {"-p": [task], "--output-format": [output_format]}
         if stream:
-            cmd_args.append("--verbose")
+            flags["--verbose"] = []
+        _index_flags(config_args, flags)
 
-        # Add config-based arguments
-        cmd_args.extend(self._build_tool_args(config, workspace))
-        cmd_args.extend(self._build_permission_args(config))
-        cmd_args.extend(self._build_dir_args(config))
-        cmd_args.extend(self._build_model_args(config))
+        return BuiltCommand(cmd_args, flags)
 
-        return cmd_args
+    def _config_args(self, config: "ClaudeConfig", workspace: Path) -> tuple[str, ...]:
+        """
+        Return config-derived arguments, cached on the fields they depend on.
+
+        ClaudeConfig is mutable and unhashable, so the key is a snapshot of
+        the relevant values; a changed config simply misses the cache.
+        """
+        key = (
+            workspace,
+            tuple(config.allowed_tools) if config.allowed_tools else None,
+            tuple(config.disallowed_tools) if config.disallowed_tools else None,
+            config.permission_mode,
+            tuple(config.add_dirs) if config.add_dirs else None,
+            config.max_turns,
+            config.model,
+        )
+        args = self._arg_cache.get(key)
+        if args is None:
+            args = tuple(
+                chain(
+                    self._build_tool_args(config, workspace),
+                    self._build_permission_args(config),
+                    self._build_dir_args(config),
+                    self._build_model_args(config),
+                )
+            )
+            if len(self._arg_cache) < self.MAX_CACHED_CONFIGS:
+                self._arg_cache[key] = args
+        return args
 
     def _build_tool_args(self, config: "ClaudeConfig", workspace: Path) -> list[str]:
         """Build tool restriction arguments."""
@@ -66,11 +130,11 @@ class CommandBuilder:
 
         if config.allowed_tools:
             tools = self._process_allowed_tools(config.allowed_tools, workspace)
-            args.extend(["--allowedTools", tools])
+            args += ("--allowedTools", tools)
 
         if config.disallowed_tools:
             tools = ",".join(config.disallowed_tools)
-            args.extend(["--disallowedTools", tools])
+            args += ("--disallowedTools", tools)
 
         return args
 
@@ -84,10 +148,9 @@ class CommandBuilder:
         """Build additional directory arguments."""
         args = []
         if config.add_dirs:
-            for d in config.add_dirs:
-                args.extend(["--add-dir", d])
+            args.extend(chain.from_iterable(("--add-dir", d) for d in config.add_dirs))
         if config.max_turns:
-            args.extend(["--max-turns", str(config.max_turns)])
+            args += ("--max-turns", str(config.max_turns))
         return args
 
     def _build_model_args(self, config: "ClaudeConfig") -> list[str]:
@@ -118,4 +181,4 @@ class CommandBuilder:
         return ",".join(processed)
 
 
-__all__ = ["CommandBuilder"]
+__all__ = ["BuiltCommand", "CommandBuilder"]
@@ -7,7 +7,9 @@ No subprocess execution, no I/O - pure transformation.
 
 import json
 import logging
-from typing import TYPE_CHECKING
+import re
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
 
 from ...models import (
     ErrorCode,
@@ -17,12 +19,58 @@ from ...models import (
     err,
     ok,
 )
+from ...utils.serialization import json_loads
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger("astrbot")
 
+# Enum members bound once for result construction
+_CLI_ERR = ErrorCode.CLI_ERROR
+_PARSE_ERR = ErrorCode.PARSE_ERROR
+
+# Error indicators in stderr, matched case-insensitively in a single scan
+_STDERR_ERROR_RE = re.compile(r"error|failed", re.IGNORECASE)
+
+# Optional simdjson: read the few result fields without building the full dict.
+# The parser is reused across calls, so no document reference may outlive parse().
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - depends on environment
+    simdjson = None
+
+_simd_parser = simdjson.Parser() if simdjson is not None else None
+
+
+class _LazyRawMetadata(Mapping):
+    """Result metadata whose "raw_data" dict is decoded from stdout on first access."""
+
+    __slots__ = ("_stdout", "_raw_data")
+
+    def __init__(self, stdout: str):
+        self._stdout = stdout
+        self._raw_data: dict | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key != "raw_data":
+            raise KeyError(key)
+        if self._raw_data is None:
+            self._raw_data = json_loads(self._stdout)
+        return self._raw_data
+
+    def __contains__(self, key: object) -> bool:
+        return key == "raw_data"
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(("raw_data",))
+
+    def __len__(self) -> int:
+        return 1
+
+    def __repr__(self) -> str:
+        return "{'raw_data': <lazy>}"
+
 
 class OutputParser:
     """
@@ -50,8 +98,13 @@ class OutputParser:
         Returns:
             Result containing ExecutionResult or ExecutionError
         """
+        if _simd_parser is not None:
+            result = self._parse_lazy(stdout, stderr, duration_ms, returncode)
+            if result is not None:
+                return result
+
         try:
-            data = json.loads(stdout)
+            data = json_loads(stdout)
             return self._parse_json_data(
                 data, stdout, stderr, duration_ms, returncode
             )
@@ -61,6 +114,57 @@ class OutputParser:
                 e, stdout, stderr, duration_ms, returncode
             )
 
+    def _parse_lazy(
+        self,
+        stdout: str,
+        stderr: str,
+        duration_ms: float,
+        returncode: int | None,
+    ) -> Result[ExecutionResult, ExecutionError] | None:
+        """
+        Parse the success path with simdjson, deferring the raw_data dict.
+
+        Returns None when stdout is not a plain JSON object so the caller
+        falls back to the full parse (and its error handling).
+        """
+        try:
+            doc = _simd_parser.parse(stdout.encode("utf-8"))
+        except (ValueError, RuntimeError):
+            return None
+
+        if not isinstance(doc, simdjson.Object):
+            del doc
+            return None
+
+        is_error = doc.get("is_error", False)
+        output = doc.get("result", "")
+        cost_usd = doc.get("total_cost_usd", 0.0)
+        session_id = doc.get("session_id", "")
+
+        proxies = (simdjson.Object, simdjson.Array)
+        nested = any(
+            isinstance(v, proxies) for v in (is_error, output, cost_usd, session_id)
+        )
+        failed = is_error or (returncode is not None and returncode != 0)
+
+        # Release parser-backed proxies before the parser is reused
+        if nested or failed:
+            data = doc.as_dict()
+            del doc, is_error, output, cost_usd, session_id
+            return self._parse_json_data(data, stdout, stderr, duration_ms, returncode)
+        del doc
+
+        # Only plain scalars remain; raw_data is decoded on first access
+        return ok(
+            ExecutionResult(
+                output=output,
+                cost_usd=cost_usd,
+                session_id=session_id,
+                duration_ms=duration_ms,
+                metadata=_LazyRawMetadata(stdout),
+            )
+        )
+
     def _parse_json_data(
         self,
         data: dict,
@@ -78,7 +182,7 @@ class OutputParser:
             )
             return err(
                 ExecutionError(
-                    code=ErrorCode.CLI_ERROR,
+                    code=_CLI_ERR,
                     message=data.get("result", "Unknown CLI error"),
                     details={"stdout": stdout, "stderr": stderr, "data": data},
                 )
@@ -87,7 +191,7 @@ class OutputParser:
         if returncode is not None and returncode != 0:
             return err(
                 ExecutionError(
-                    code=ErrorCode.CLI_ERROR,
+                    code=_CLI_ERR,
                     message="Claude CLI exited with non-zero status",
                     details={
                         "stdout": stdout,
@@ -121,7 +225,7 @@ class OutputParser:
         if returncode is not None and returncode != 0:
             return err(
                 ExecutionError(
-                    code=ErrorCode.PARSE_ERROR,
+                    code=_PARSE_ERR,
                     message=f"Failed to parse CLI output: {error}",
                     details={
                         "stdout": stdout,
@@ -132,14 +236,12 @@ class OutputParser:
             )
 
         # Check stderr for error indicators
-        has_error = stderr and (
-            "error" in stderr.lower() or "failed" in stderr.lower()
-        )
+        has_error = bool(stderr) and _STDERR_ERROR_RE.search(stderr) is not None
 
         if has_error or not stdout:
             return err(
                 ExecutionError(
-                    code=ErrorCode.PARSE_ERROR,
+                    code=_PARSE_ERR,
                     message=f"Failed to parse CLI output: {error}",
                     details={"stdout": stdout, "stderr": stderr},
                 )
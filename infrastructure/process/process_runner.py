@@ -24,6 +24,16 @@ def _resolve_cmd_args(cmd_args: list[str]) -> list[str]:
     return [resolved, *cmd_args[1:]]
 
 
+async def _iter_lines(proc: asyncio.subprocess.Process) -> AsyncIterator[bytes]:
+    """Yield stdout lines from a running process until EOF."""
+    readline = proc.stdout.readline
+    while True:
+        line = await readline()
+        if not line:
+            break
+        yield line
+
+
 class ProcessRunner:
     """
     Executes subprocess commands.
@@ -107,14 +117,7 @@ class ProcessRunner:
         )
 
         try:
-            async def read_with_timeout():
-                while True:
-                    line = await proc.stdout.readline()
-                    if not line:
-                        break
-                    yield line
-
-            async for line in read_with_timeout():
+            async for line in _iter_lines(proc):
                 yield line
 
             await proc.wait()
@@ -149,14 +152,7 @@ class ProcessRunner:
             cwd=str(cwd),
         )
 
-        async def line_iterator():
-            while True:
-                line = await proc.stdout.readline()
-                if not line:
-                    break
-                yield line
-
-        return proc, line_iterator()
+        return proc, _iter_lines(proc)
 
 
 __all__ = ["ProcessRunner"]
@@ -5,14 +5,99 @@ Single responsibility: Parse individual stream-json lines into StreamChunk.
 No I/O, no accumulation - pure line-by-line transformation.
 """
 
+import functools
 import json
 import logging
 import time
+from collections.abc import Mapping
+from typing import Any
 
+from ...domain.errors import FrozenMap
 from ...models import ChunkType, StreamChunk
+from ...utils.serialization import HAS_ORJSON, json_loads
+
+# Without orjson, a reused simdjson parser still beats the stdlib decoder on
+# stream lines. Each document is converted to a dict before the next parse,
+# so no proxy outlives the parser buffer.
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - depends on environment
+    simdjson = None
+
+_simd_parser = simdjson.Parser() if simdjson is not None and not HAS_ORJSON else None
 
 logger = logging.getLogger("astrbot")
 
+# Enum members bound once for the per-line classification path
+_THINKING = ChunkType.THINKING
+_TOOL_USE = ChunkType.TOOL_USE
+_ERROR = ChunkType.ERROR
+_RESULT = ChunkType.RESULT
+_STATUS = ChunkType.STATUS
+
+# Shared read-only metadata for recurring chunk types (bounded vocabulary)
+_META_CACHE: dict[str, Mapping[str, str]] = {}
+_META_CACHE_MAX = 64
+_RAW_META: Mapping[str, bool] = FrozenMap({"raw": True})
+
+# Classification cache for repeated stream lines; long lines bypass it
+_CLASSIFY_CACHE_SIZE = 256
+_CLASSIFY_LINE_MAX = 4096
+
+
+def _decode_object(line: str) -> Any:
+    """Decode a JSON line with the fastest available decoder."""
+    if _simd_parser is None:
+        return json_loads(line)
+    try:
+        doc = _simd_parser.parse(line.encode("utf-8"))
+    except ValueError as e:
+        raise json.JSONDecodeError(str(e), line, 0) from None
+    return doc.as_dict() if isinstance(doc, simdjson.Object) else doc
+
+
+def _type_meta(chunk_type: str) -> Mapping[str, str]:
+    """Return shared read-only {"type": chunk_type} metadata."""
+    meta = _META_CACHE.get(chunk_type)
+    if meta is None:
+        meta = FrozenMap({"type": chunk_type})
+        if len(_META_CACHE) < _META_CACHE_MAX:
+            _META_CACHE[chunk_type] = meta
+    return meta
+
+
+# Exact names seen in practice; anything else goes through the substring rules
+_TYPE_MAP: dict[str, ChunkType] = {
+    "thinking": _THINKING,
+    "tool_use": _TOOL_USE,
+    "tool_result": _TOOL_USE,
+    "error": _ERROR,
+    "result": _RESULT,
+}
+
+
+@functools.lru_cache(maxsize=_META_CACHE_MAX)
+def _type_from_name(chunk_type_str: str) -> ChunkType | None:
+    """
+    Map a chunk "type" value to ChunkType, None if it names no known type.
+
+    Substring rules are checked in priority order: think > tool > error > result.
+    """
+    chunk_type = _TYPE_MAP.get(chunk_type_str)
+    if chunk_type is not None:
+        return chunk_type
+
+    lowered = chunk_type_str.lower()
+    if "think" in lowered:
+        return _THINKING
+    elif "tool" in lowered:
+        return _TOOL_USE
+    elif "error" in lowered:
+        return _ERROR
+    elif "result" in lowered:
+        return _RESULT
+    return None
+
 
 class ChunkParser:
     """
@@ -22,6 +107,12 @@ class ChunkParser:
     Pure function-like class: no side effects, deterministic output.
     """
 
+    def __init__(self):
+        # Per instance so subclass overrides of the helpers are respected
+        self._classify_cached = functools.lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)(
+            self._classify
+        )
+
     def parse_line(self, line: str) -> StreamChunk | None:
         """
         Parse a single line of streaming output.
@@ -35,26 +126,44 @@ class ChunkParser:
         if not line:
             return None
 
-        try:
-            chunk_data = json.loads(line)
-            chunk_type = self._determine_chunk_type(chunk_data)
-            content = self._extract_content(chunk_data)
+        if len(line) <= _CLASSIFY_LINE_MAX:
+            chunk_type, content, metadata = self._classify_cached(line)
+        else:
+            chunk_type, content, metadata = self._classify(line)
 
-            return StreamChunk(
-                chunk_type=chunk_type,
-                content=content,
-                timestamp=time.time(),
-                metadata={"type": chunk_data.get("type", "unknown")},
-            )
+        return StreamChunk(
+            chunk_type=chunk_type,
+            content=content,
+            timestamp_ns=time.time_ns(),
+            metadata=metadata,
+        )
 
+    def _classify(self, line: str) -> tuple[ChunkType, str, Mapping]:
+        """
+        Deterministic part of parse_line: decode and classify a line.
+
+        Args:
+            line: Raw non-empty line
+
+        Returns:
+            Tuple of (chunk_type, content, read-only metadata)
+        """
+        # Stream chunks are JSON objects; anything else is raw text, so skip
+        # the decoder entirely (also keeps bare scalars/arrays off the dict path)
+        if line[0] != "{":
+            return _STATUS, line, _RAW_META
+
+        try:
+            chunk_data = _decode_object(line)
         except json.JSONDecodeError:
             # Not JSON, treat as raw text chunk
-            return StreamChunk(
-                chunk_type=ChunkType.STATUS,
-                content=line,
-                timestamp=time.time(),
-                metadata={"raw": True},
-            )
+            return _STATUS, line, _RAW_META
+
+        return (
+            self._determine_chunk_type(chunk_data),
+            self._extract_content(chunk_data),
+            _type_meta(chunk_data.get("type", "unknown")),
+        )
 
     def _determine_chunk_type(self, chunk_data: dict) -> ChunkType:
         """
@@ -67,27 +176,22 @@ class ChunkParser:
             ChunkType enum value
         """
         # Check for type field
-        if "type" in chunk_data:
-            chunk_type_str = chunk_data["type"].lower()
-            if "think" in chunk_type_str:
-                return ChunkType.THINKING
-            elif "tool" in chunk_type_str:
-                return ChunkType.TOOL_USE
-            elif "error" in chunk_type_str:
-                return ChunkType.ERROR
-            elif "result" in chunk_type_str:
-                return ChunkType.RESULT
+        chunk_type_str = chunk_data.get("type")
+        if isinstance(chunk_type_str, str):
+            chunk_type = _type_from_name(chunk_type_str)
+            if chunk_type is not None:
+                return chunk_type
 
         # Check for error indicators
         if chunk_data.get("is_error") or "error" in chunk_data:
-            return ChunkType.ERROR
+            return _ERROR
 
         # Check for result indicators
         if "result" in chunk_data or "output" in chunk_data:
-            return ChunkType.RESULT
+            return _RESULT
 
         # Default to status
-        return ChunkType.STATUS
+        return _STATUS
 
     def _extract_content(self, chunk_data: dict) -> str:
         """
@@ -6,8 +6,10 @@ Composes ChunkParser and ProcessRunner.
 """
 
 import asyncio
+import codecs
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
 from ...models import (
@@ -27,6 +29,41 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("astrbot")
 
+# Raw stdout read size; lines may span reads and exceed StreamReader's limit
+_READ_SIZE = 64 * 1024
+
+
+async def _read_line_batches(
+    stream: asyncio.StreamReader,
+    read_size: int = _READ_SIZE,
+) -> AsyncIterator[list[str]]:
+    """
+    Read a byte stream and yield batches of decoded lines.
+
+    A single incremental UTF-8 decoder is kept for the whole stream, so
+    multi-byte characters split across reads are decoded correctly.
+
+    Yields:
+        Lines (without trailing newline) completed by each read
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    decode = decoder.decode
+    read = stream.read
+    pending = ""
+
+    while True:
+        data = await read(read_size)
+        if not data:
+            tail = pending + decode(b"", final=True)
+            if tail:
+                yield [tail]
+            return
+
+        lines = (pending + decode(data)).split("\n")
+        pending = lines.pop()
+        if lines:
+            yield lines
+
 
 class StreamProcessor:
     """
@@ -65,7 +102,7 @@ class StreamProcessor:
         Process streaming output from subprocess.
 
         Args:
-            proc: Running subprocess with stdout pipe
+            proc: Running subprocess with stdout pipe (stderr pipe optional)
             on_progress: Optional callback for progress updates
             start_time: Start time for duration calculation
 
@@ -83,34 +120,49 @@ class StreamProcessor:
                 else None
             )
 
-            # Read stdout line by line
-            while True:
-                line = await proc.stdout.readline()
-                if not line:
-                    break
-
-                line_text = line.decode("utf-8", errors="ignore").strip()
-                if not line_text:
-                    continue
-
-                chunk_count += 1
-
-                # Parse line into chunk
-                chunk = self._chunk_parser.parse_line(line_text)
-
-                if chunk:
-                    if chunk.chunk_type == ChunkType.ERROR:
-                        error_chunk = chunk
-                    # Invoke callback if provided
-                    if on_progress:
-                        try:
-                            on_progress(chunk)
-                        except Exception as e:
-                            logger.warning(f"[StreamProcessor] Callback failed: {e}")
-
-                    # Accumulate content
-                    if chunk.content:
-                        accumulated_output.append(chunk.content)
+            # Bind hot-loop lookups to locals
+            batches = _read_line_batches(proc.stdout)
+            parse = self._chunk_parser.parse_line
+            append = accumulated_output.append
+            error_type = ChunkType.ERROR
+
+            # Read stdout in batches of lines (specialized on callback presence)
+            if on_progress is None:
+                async for lines in batches:
+                    for line_text in lines:
+                        line_text = line_text.strip()
+                        if not line_text:
+                            continue
+
+                        chunk_count += 1
+                        chunk = parse(line_text)
+
+                        if chunk:
+                            if chunk.chunk_type is error_type:
+                                error_chunk = chunk
+                            content = chunk.content
+                            if content:
+                                append(content)
+            else:
+                async for lines in batches:
+                    for line_text in lines:
+                        line_text = line_text.strip()
+                        if not line_text:
+                            continue
+
+                        chunk_count += 1
+                        chunk = parse(line_text)
+
+                        if chunk:
+                            if chunk.chunk_type is error_type:
+                                error_chunk = chunk
+                            try:
+                                on_progress(chunk)
+                            except Exception as e:
+                                logger.warning(f"[StreamProcessor] Callback failed: {e}")
+                            content = chunk.content
+                            if content:
+                                append(content)
 
             # Wait for process to complete
             await proc.wait()
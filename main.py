@@ -15,16 +15,39 @@ from astrbot.api import AstrBotConfig, logger
 from astrbot.api.event import AstrMessageEvent, filter
 from astrbot.api.star import Context, Star, StarTools, register
 
-# Use new modular architecture
-from .application import ClaudeExecutor
+# Use new modular architecture (ClaudeExecutor is imported on first use)
 from .claude_config import ClaudeConfigManager
 from .infrastructure.config import validate_config
 from .infrastructure.http import ServerManager
 from .infrastructure.installer import CLIInstaller, MarketplaceManager
+from .utils import (
+    ensure_dir,
+    install_queue_logging,
+    uninstall_queue_logging,
+)
 
 PLUGIN_DIR = Path(__file__).parent
 VERSION = "2.2.0"
 
+# Strong references to background tasks so they are not garbage collected
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Create a task and keep it referenced until it completes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _file_has_text(path: Path, text: str) -> bool:
+    """True if path is a readable file whose content equals text."""
+    try:
+        return path.read_text(encoding="utf-8") == text
+    except (OSError, UnicodeDecodeError):
+        return False
+
 
 @register(
     "astrbot_plugin_claudecode", "Claude", "Claude Code as LLM Tool", VERSION
@@ -57,16 +80,24 @@ class ClaudeCodePlugin(Star):
             self.workspace = StarTools.get_data_dir() / workspace_name
         except Exception:
             self.workspace = PLUGIN_DIR / workspace_name
-        self.workspace.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.workspace)
         logger.info(f"[PROCESS] Workspace initialized: {self.workspace}")
 
+        # Resolve ~/.claude once; CLAUDE.md writes are skipped when unchanged
+        self._claude_home = Path.home() / ".claude"
+
+        # Parse skills list once
+        self._skills = tuple(
+            s.strip()
+            for s in (config.get("skills_to_install", "") or "").split(",")
+            if s.strip()
+        )
+
         # Initialize components (using new modular architecture)
         self.config_manager = ClaudeConfigManager.from_plugin_config(config, self.workspace)
         self.cli_installer = CLIInstaller()
         self.marketplace_manager = MarketplaceManager()
-        self.claude_executor = ClaudeExecutor(
-            workspace=self.workspace, config_manager=self.config_manager
-        )
+        self._executor = None
         self.server_manager = ServerManager(
             workspace=self.workspace,
             port=config.get("http_server_port", 6200),
@@ -80,8 +111,11 @@ class ClaudeCodePlugin(Star):
                 f"[PROCESS] Config validation failed: {self._validation_error}"
             )
 
+        # Optional queued logging: handler I/O moves to a background thread
+        self._queue_logging = bool(config.get("async_logging", False)) and install_queue_logging()
+
         # Start async initialization
-        self._init_task = asyncio.create_task(self._async_init())
+        self._init_task = _spawn(self._async_init())
         self._init_task.add_done_callback(self._handle_init_done)
 
         duration_ms = (time.time() - start_time) * 1000
@@ -125,14 +159,12 @@ class ClaudeCodePlugin(Star):
             self._config_ready = False
             return
 
-        # Write CLAUDE.md (project instructions)
-        await self._write_claude_md()
-
-        # Install Skills
-        await self._install_skills()
-
-        # Start HTTP server for web deployment
-        await self._start_http_server()
+        # Independent setup steps: CLAUDE.md, skills, HTTP server
+        await asyncio.gather(
+            self._write_claude_md(),
+            self._install_skills(),
+            self._start_http_server(),
+        )
 
         duration_ms = (time.time() - start_time) * 1000
         logger.info(f"[EXIT] _async_init duration_ms={duration_ms:.2f}")
@@ -144,15 +176,22 @@ class ClaudeCodePlugin(Star):
             return
 
         try:
+            claude_md_path = self._claude_home / "CLAUDE.md"
+            workspace_claude_md = self.workspace / "CLAUDE.md"
+
+            # Skip the write when the file already holds this content
+            if _file_has_text(claude_md_path, claude_md) and _file_has_text(
+                workspace_claude_md, claude_md
+            ):
+                logger.debug("[PROCESS] CLAUDE.md unchanged, skipping write")
+                return
+
             # Write to ~/.claude/CLAUDE.md (global config)
-            claude_dir = Path.home() / ".claude"
-            claude_dir.mkdir(parents=True, exist_ok=True)
-            claude_md_path = claude_dir / "CLAUDE.md"
+            ensure_dir(self._claude_home)
             claude_md_path.write_text(claude_md, encoding="utf-8")
             logger.info("[PROCESS] CLAUDE.md updated in ~/.claude/")
 
             # Write to workspace/CLAUDE.md (for -p mode execution)
-            workspace_claude_md = self.workspace / "CLAUDE.md"
             workspace_claude_md.write_text(claude_md, encoding="utf-8")
             logger.info("[PROCESS] CLAUDE.md updated in workspace/")
         except Exception as e:
@@ -160,11 +199,19 @@ class ClaudeCodePlugin(Star):
 
     async def _install_skills(self):
         """Install configured skills."""
-        skills_str = self.config.get("skills_to_install", "")
-        if not skills_str:
+        skills = self._skills
+        if not skills:
+            return
+
+        # Skip every install up front if the marketplace cannot be prepared
+        ok, msg = await self.marketplace_manager.ensure_marketplace()
+        if not ok:
+            logger.warning(f"[PROCESS] Skills skipped, marketplace not ready: {msg}")
             return
 
-        for skill in [s.strip() for s in skills_str.split(",") if s.strip()]:
+        # One at a time: concurrent `claude plugin install` runs read and
+        # rewrite the same plugin state under ~/.claude and can lose entries
+        for skill in skills:
             success, result = await self.marketplace_manager.install_skill(skill)
             logger.info(f"[PROCESS] Skill {skill}: {result}")
 
@@ -174,6 +221,17 @@ class ClaudeCodePlugin(Star):
         # Fixes pgrep issue in containers
         await self.server_manager.start()
 
+    @property
+    def claude_executor(self):
+        """Executor, created lazily on first tool invocation."""
+        if self._executor is None:
+            from .application import ClaudeExecutor
+
+            self._executor = ClaudeExecutor(
+                workspace=self.workspace, config_manager=self.config_manager
+            )
+        return self._executor
+
     def _check_config_ready(self) -> str | None:
         """Check if configuration is ready. Returns error message if not ready."""
         if self._validation_error:
@@ -182,11 +240,6 @@ class ClaudeCodePlugin(Star):
             return "Claude Code not ready, check plugin logs"
         return None
 
-    @staticmethod
-    def _truncate_task(task: str, max_len: int = 50) -> str:
-        """Truncate task description for logging."""
-        return task[:max_len] + "..." if len(task) > max_len else task
-
     @filter.llm_tool(name="claude_code")
     async def claude_code(self, event: AstrMessageEvent, task: str) -> str:
         """
@@ -210,7 +263,7 @@ class ClaudeCodePlugin(Star):
             string: Execution result (file paths, web URLs, etc.)
         """
         start_time = time.time()
-        logger.info(f"[ENTRY] claude_code task={self._truncate_task(task)}")
+        logger.info("[ENTRY] claude_code task=%.50s", task)
 
         # Check configuration
         error = self._check_config_ready()
@@ -232,6 +285,12 @@ class ClaudeCodePlugin(Star):
 
         return f"Execution failed: {result.get('error', 'unknown')}"
 
+    async def terminate(self):
+        """Plugin unload hook: restore the logger handlers taken over by async_logging."""
+        if self._queue_logging:
+            uninstall_queue_logging()
+            self._queue_logging = False
+
     # NOTE: 流式工具暂时禁用，stream-json输出过于冗长
     # @filter.llm_tool(name="claude_code_stream")
     # async def claude_code_stream(
@@ -241,7 +300,6 @@ class ClaudeCodePlugin(Star):
     #     Claude Code (Streaming) - AI assistant with real-time progress.
     #     """
     #     start_time = time.time()
-    #     logger.info(f"[ENTRY] claude_code_stream task={self._truncate_task(task)}")
     #
     #     error = self._check_config_ready()
     #     if error:
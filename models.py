@@ -14,22 +14,29 @@ Usage:
 """
 
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Generic, TypeVar, Union
+from typing import Any, Generic, TypeVar, Union
+
+from .domain.errors import (
+    ErrorCode,
+    ExecutionError,
+    IOError,
+    ValidationError,
+    _empty_map,
+)
 
 # Type variables for generic Result pattern
 T = TypeVar("T")
 E = TypeVar("E")
 
-
 # =============================================================================
 # Result Pattern - Functional Error Handling
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ok(Generic[T]):
     """
     Represents a successful result containing a value.
@@ -58,7 +65,7 @@ class Ok(Generic[T]):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Err(Generic[E]):
     """
     Represents a failed result containing an error.
@@ -108,60 +115,8 @@ def err(error: E) -> Err[E]:
 # Error Types
 # =============================================================================
 
-
-class ErrorCode(str, Enum):
-    """Structured error codes for programmatic handling."""
-
-    TIMEOUT = "TIMEOUT"
-    PARSE_ERROR = "PARSE_ERROR"
-    CLI_ERROR = "CLI_ERROR"
-    NOT_INSTALLED = "NOT_INSTALLED"
-    PERMISSION_DENIED = "PERMISSION_DENIED"
-    INVALID_CONFIG = "INVALID_CONFIG"
-    IO_ERROR = "IO_ERROR"
-    UNKNOWN = "UNKNOWN"
-
-
-@dataclass
-class ValidationError:
-    """Configuration validation error."""
-
-    field: str
-    message: str
-
-    def __str__(self) -> str:
-        return f"[{self.field}] {self.message}"
-
-
-@dataclass
-class ExecutionError:
-    """
-    Structured execution error.
-
-    Attributes:
-        code: Error code for programmatic handling
-        message: Human-readable error message
-        details: Additional context (stdout, stderr, etc.)
-    """
-
-    code: ErrorCode
-    message: str
-    details: dict = field(default_factory=dict)
-
-    def __str__(self) -> str:
-        return f"[{self.code.value}] {self.message}"
-
-
-@dataclass
-class IOError:
-    """File I/O operation error."""
-
-    path: str
-    operation: str
-    reason: str
-
-    def __str__(self) -> str:
-        return f"[{self.operation}] {self.path}: {self.reason}"
+# ErrorCode, ValidationError, ExecutionError and IOError are defined in
+# domain/errors.py and re-exported from this module.
 
 
 # =============================================================================
@@ -169,7 +124,7 @@ class IOError:
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     """
     Successful execution result.
@@ -179,18 +134,18 @@ class ExecutionResult:
         cost_usd: Execution cost in USD
         session_id: Claude session identifier
         duration_ms: Execution time in milliseconds
-        metadata: Additional execution metadata
+        metadata: Additional execution metadata, read-only empty if omitted
     """
 
     output: str
     cost_usd: float = 0.0
     session_id: str = ""
     duration_ms: float = 0.0
-    metadata: dict = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_map)
 
 
 class ChunkType(str, Enum):
-    """Types of streaming chunks."""
+    """Types of streaming chunks (singletons: compare with ``is``)."""
 
     THINKING = "thinking"
     TOOL_USE = "tool_use"
@@ -199,22 +154,27 @@ class ChunkType(str, Enum):
     STATUS = "status"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StreamChunk:
     """
-    A chunk of streaming output.
+    A chunk of streaming output (immutable once parsed).
 
     Attributes:
         chunk_type: Type of this chunk
         content: The chunk content
-        timestamp: Unix timestamp when chunk was received
-        metadata: Additional chunk metadata
+        timestamp_ns: Wall-clock time (epoch ns) when chunk was received
+        metadata: Additional chunk metadata, read-only empty if omitted
     """
 
     chunk_type: ChunkType
     content: str
-    timestamp: float = field(default_factory=time.time)
-    metadata: dict = field(default_factory=dict)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_map)
+
+    @property
+    def timestamp(self) -> float:
+        """Epoch timestamp in seconds, as ``time.time()`` (backward compatible)."""
+        return self.timestamp_ns / 1e9
 
 
 # Type alias for progress callback
@@ -226,7 +186,7 @@ ProgressCallback = Callable[[StreamChunk], None]
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeConfig:
     """
     Claude Code configuration.
@@ -0,0 +1,38 @@
+"""
+AstrBot Stub - Stand-in astrbot modules for running tests without AstrBot.
+
+Importing the plugin package pulls in main.py, which imports astrbot. A
+tests/conftest.py cannot install the stub in time: pytest imports the
+plugin package before any conftest inside it. This module is therefore
+loaded standalone, either by run_tests.py or as a pytest plugin
+(``-p astrbot_stub`` with tests/ on PYTHONPATH), so xdist workers install
+it too.
+"""
+
+import logging
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+
+def install() -> None:
+    """Register the mock astrbot modules in sys.modules."""
+    identity = lambda *args, **kwargs: (lambda obj: obj)  # noqa: E731
+
+    astrbot = MagicMock()
+    astrbot.api.event.filter.llm_tool = identity
+    astrbot.api.star.register = identity
+    astrbot.api.star.Star = type("Star", (), {"__init__": lambda self, context: None})
+    astrbot.api.star.StarTools.get_data_dir = lambda: Path.cwd()
+    astrbot.api.AstrBotConfig = dict
+    astrbot.api.logger = logging.getLogger("test")
+
+    sys.modules["astrbot"] = astrbot
+    sys.modules["astrbot.api"] = astrbot.api
+    sys.modules["astrbot.api.event"] = astrbot.api.event
+    sys.modules["astrbot.api.star"] = astrbot.api.star
+
+
+# Installed on import: pytest imports -p plugins before the initial
+# conftests, and those already import the plugin package
+install()
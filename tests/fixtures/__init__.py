@@ -3,6 +3,6 @@ Test Fixtures - Sample outputs and mock objects for testing.
 """
 
 from .mock_process import MockProcessRunner
-from .sample_outputs import SAMPLE_OUTPUTS
+from .sample_outputs import SAMPLE_OUTPUTS, SAMPLE_OUTPUTS_BYTES
 
-__all__ = ["SAMPLE_OUTPUTS", "MockProcessRunner"]
+__all__ = ["SAMPLE_OUTPUTS", "SAMPLE_OUTPUTS_BYTES", "MockProcessRunner"]
@@ -26,13 +26,13 @@ MALFORMED_OUTPUT = "This is not JSON output\nBut it contains useful information"
 # Empty output
 EMPTY_OUTPUT = ""
 
-# Stream JSON chunks
-STREAM_CHUNKS = [
+# Stream JSON chunks (tuple: immutable, safe to share and hash)
+STREAM_CHUNKS = (
     json.dumps({"type": "thinking", "content": "Analyzing the task..."}),
     json.dumps({"type": "tool_use", "content": "Reading file main.py"}),
     json.dumps({"type": "tool_use", "content": "Writing file output.txt"}),
     json.dumps({"type": "result", "content": "Task completed successfully"}),
-]
+)
 
 # All sample outputs
 SAMPLE_OUTPUTS = {
@@ -43,4 +43,13 @@ SAMPLE_OUTPUTS = {
     "stream_chunks": STREAM_CHUNKS,
 }
 
-__all__ = ["SAMPLE_OUTPUTS"]
+# Pre-encoded variants for parsers that consume raw stdout bytes
+SAMPLE_OUTPUTS_BYTES = {
+    "success": SUCCESS_OUTPUT.encode("utf-8"),
+    "error": ERROR_OUTPUT.encode("utf-8"),
+    "malformed": MALFORMED_OUTPUT.encode("utf-8"),
+    "empty": EMPTY_OUTPUT.encode("utf-8"),
+    "stream_chunks": tuple(chunk.encode("utf-8") for chunk in STREAM_CHUNKS),
+}
+
+__all__ = ["SAMPLE_OUTPUTS", "SAMPLE_OUTPUTS_BYTES"]
@@ -1,55 +1,25 @@
 """
 Test Runner - Run unit tests without astrbot dependency.
+
+Delegates to pytest on tests/unit (in parallel when pytest-xdist is
+installed); falls back to the inline smoke tests below when pytest is
+unavailable or --inline is passed.
 """
 
+import importlib.util
 import json
+import os
+import subprocess
 import sys
 from pathlib import Path
 
+# Importing the stub mocks the astrbot modules to prevent import errors
+import astrbot_stub  # noqa: F401
+
 # Add parent directory to path
 plugin_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(plugin_dir.parent))
 
-# Mock astrbot module to prevent import errors
-class MockAstrbot:
-    class api:
-        class event:
-            class filter:
-                @staticmethod
-                def llm_tool(name):
-                    def decorator(func):
-                        return func
-                    return decorator
-            class AstrMessageEvent:
-                pass
-        class star:
-            class Context:
-                pass
-            class Star:
-                def __init__(self, context):
-                    pass
-            @staticmethod
-            def register(*args, **kwargs):
-                def decorator(cls):
-                    return cls
-                return decorator
-            class StarTools:
-                @staticmethod
-                def get_data_dir():
-                    return Path.cwd()
-        @staticmethod
-        def logger():
-            import logging
-            return logging.getLogger("test")
-        class AstrBotConfig(dict):
-            pass
-
-# Install mock
-sys.modules["astrbot"] = MockAstrbot
-sys.modules["astrbot.api"] = MockAstrbot.api
-sys.modules["astrbot.api.event"] = MockAstrbot.api.event
-sys.modules["astrbot.api.star"] = MockAstrbot.api.star
-
 # Now import the actual modules
 from astrbot_plugin_claudecode.infrastructure.config.config_validator import (
     ConfigValidator,
@@ -210,7 +180,31 @@ def test_chunk_parser():
     print("  [PASS] Empty line returns None")
 
 
+def run_pytest() -> int | None:
+    """Run tests/unit under pytest, None if pytest is not installed."""
+    if importlib.util.find_spec("pytest") is None:
+        return None
+
+    # The stub is loaded as a plugin so every (xdist) worker installs it
+    tests_dir = str(Path(__file__).parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [tests_dir, env.get("PYTHONPATH")]))
+
+    cmd = [
+        sys.executable, "-m", "pytest", "-q", "-p", "astrbot_stub",
+        str(Path(plugin_dir.name, "tests", "unit")),
+    ]
+    if importlib.util.find_spec("xdist") is not None:
+        cmd += ["-n", "auto"]
+    return subprocess.run(cmd, cwd=plugin_dir.parent, env=env).returncode
+
+
 if __name__ == "__main__":
+    if "--inline" not in sys.argv:
+        returncode = run_pytest()
+        if returncode is not None:
+            sys.exit(returncode)
+
     test_config_validator()
     test_output_parser()
     test_command_builder()
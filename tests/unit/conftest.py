@@ -0,0 +1,34 @@
+"""
+Unit Test Configuration - Shared stateless component fixtures.
+"""
+
+import pytest
+
+from ...infrastructure.config.config_validator import ConfigValidator
+from ...infrastructure.process.command_builder import CommandBuilder
+from ...infrastructure.process.output_parser import OutputParser
+from ...infrastructure.stream.chunk_parser import ChunkParser
+
+
+@pytest.fixture(scope="session")
+def chunk_parser():
+    """Shared ChunkParser instance."""
+    return ChunkParser()
+
+
+@pytest.fixture(scope="session")
+def output_parser():
+    """Shared OutputParser instance."""
+    return OutputParser()
+
+
+@pytest.fixture(scope="session")
+def command_builder():
+    """Shared CommandBuilder instance."""
+    return CommandBuilder()
+
+
+@pytest.fixture(scope="session")
+def config_validator():
+    """Shared ConfigValidator instance."""
+    return ConfigValidator()
@@ -2,105 +2,105 @@
 Test Chunk Parser - Unit tests for ChunkParser.
 """
 
+import copy
 import json
+import pickle
+import time
+
+import pytest
 
-from ...infrastructure.stream.chunk_parser import ChunkParser
 from ...models import ChunkType
 
 
 class TestChunkParser:
     """Tests for ChunkParser."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = ChunkParser()
-
-    def test_parse_thinking_chunk(self):
+    def test_parse_thinking_chunk(self, chunk_parser):
         """Test parsing thinking chunk."""
         line = json.dumps({"type": "thinking", "content": "Analyzing..."})
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.THINKING
         assert chunk.content == "Analyzing..."
 
-    def test_parse_tool_use_chunk(self):
+    def test_parse_tool_use_chunk(self, chunk_parser):
         """Test parsing tool use chunk."""
         line = json.dumps({"type": "tool_use", "content": "Reading file.py"})
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.TOOL_USE
         assert chunk.content == "Reading file.py"
 
-    def test_parse_result_chunk(self):
+    def test_parse_result_chunk(self, chunk_parser):
         """Test parsing result chunk."""
         line = json.dumps({"type": "result", "content": "Task completed"})
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.RESULT
         assert chunk.content == "Task completed"
 
-    def test_parse_error_chunk(self):
+    def test_parse_error_chunk(self, chunk_parser):
         """Test parsing error chunk."""
         line = json.dumps({"type": "error", "content": "Something failed"})
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.ERROR
         assert chunk.content == "Something failed"
 
-    def test_parse_error_by_is_error_field(self):
+    def test_parse_error_by_is_error_field(self, chunk_parser):
         """Test parsing error by is_error field."""
         line = json.dumps({"is_error": True, "message": "Error occurred"})
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.ERROR
 
-    def test_parse_result_by_result_field(self):
+    def test_parse_result_by_result_field(self, chunk_parser):
         """Test parsing result by result field."""
         line = json.dumps({"result": "Done"})
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.RESULT
         assert chunk.content == "Done"
 
-    def test_parse_status_default(self):
+    def test_parse_status_default(self, chunk_parser):
         """Test default to status type."""
         line = json.dumps({"some_field": "some_value"})
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.STATUS
 
-    def test_parse_raw_text(self):
+    def test_parse_raw_text(self, chunk_parser):
         """Test parsing non-JSON text."""
         line = "This is raw text output"
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk is not None
         assert chunk.chunk_type == ChunkType.STATUS
         assert chunk.content == "This is raw text output"
         assert chunk.metadata.get("raw") is True
 
-    def test_parse_empty_line(self):
+    def test_parse_empty_line(self, chunk_parser):
         """Test parsing empty line returns None."""
-        chunk = self.parser.parse_line("")
+        chunk = chunk_parser.parse_line("")
 
         assert chunk is None
 
-    def test_parse_content_extraction_priority(self):
+    def test_parse_content_extraction_priority(self, chunk_parser):
         """Test content extraction field priority."""
         # 'content' has highest priority
         line = json.dumps({
@@ -109,25 +109,76 @@ class TestChunkParser:
             "message": "from_message",
         })
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk.content == "from_content"
 
-    def test_parse_text_field_extraction(self):
+    def test_parse_text_field_extraction(self, chunk_parser):
         """Test text field extraction when content missing."""
         line = json.dumps({
             "text": "from_text",
             "message": "from_message",
         })
 
-        chunk = self.parser.parse_line(line)
+        chunk = chunk_parser.parse_line(line)
 
         assert chunk.content == "from_text"
 
-    def test_parse_timestamp_set(self):
-        """Test timestamp is set on chunk."""
+    def test_parse_timestamp_set(self, chunk_parser):
+        """Test timestamp is wall-clock epoch seconds."""
         line = json.dumps({"type": "status", "content": "test"})
 
-        chunk = self.parser.parse_line(line)
+        before = time.time()
+        chunk = chunk_parser.parse_line(line)
+
+        assert before - 1 <= chunk.timestamp <= time.time() + 1
+
+    def test_parse_metadata_shared_for_same_type(self, chunk_parser):
+        """Test metadata is shared and read-only for recurring types."""
+        first = chunk_parser.parse_line(json.dumps({"type": "assistant", "content": "a"}))
+        second = chunk_parser.parse_line(json.dumps({"type": "assistant", "content": "b"}))
+
+        assert first.metadata == {"type": "assistant"}
+        assert first.metadata is second.metadata
+        with pytest.raises(TypeError):
+            first.metadata["type"] = "changed"
+
+    def test_parsed_chunks_are_picklable(self, chunk_parser):
+        """Test chunks with shared metadata survive pickle and deepcopy."""
+        for line in ('{"type": "thinking", "content": "x"}', "raw text"):
+            chunk = chunk_parser.parse_line(line)
+
+            assert pickle.loads(pickle.dumps(chunk)) == chunk
+            assert copy.deepcopy(chunk) == chunk
+
+    def test_parse_repeated_line_gets_fresh_timestamp(self, chunk_parser):
+        """Test repeated lines reuse classification but not timestamps."""
+        line = json.dumps({"type": "status", "content": "ping"})
+
+        first = chunk_parser.parse_line(line)
+        second = chunk_parser.parse_line(line)
+
+        assert first is not second
+        assert first.content == second.content == "ping"
+        assert second.timestamp_ns >= first.timestamp_ns
+
+    def test_parse_non_object_json_as_raw(self, chunk_parser):
+        """Test JSON scalars and arrays are treated as raw text."""
+        for line in ("42", '"quoted"', "[1, 2]"):
+            chunk = chunk_parser.parse_line(line)
+
+            assert chunk.chunk_type == ChunkType.STATUS
+            assert chunk.content == line
+
+    def test_parse_type_substring_priority(self, chunk_parser):
+        """Test unknown type names still classify by substring in priority order."""
+        cases = {
+            "thinking_delta": ChunkType.THINKING,
+            "tool_error": ChunkType.TOOL_USE,
+            "ERROR_RESULT": ChunkType.ERROR,
+            "final_result": ChunkType.RESULT,
+        }
+        for type_name, expected in cases.items():
+            chunk = chunk_parser.parse_line(json.dumps({"type": type_name, "content": "x"}))
 
-        assert chunk.timestamp > 0
+            assert chunk.chunk_type is expected
@@ -4,24 +4,20 @@ Test Command Builder - Unit tests for CommandBuilder.
 
 from pathlib import Path
 
-from ...infrastructure.process.command_builder import CommandBuilder
 from ...models import ClaudeConfig
 
 
 class TestCommandBuilder:
     """Tests for CommandBuilder."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.builder = CommandBuilder()
-        self.workspace = Path("/test/workspace")
+    WORKSPACE = Path("/test/workspace")
 
-    def test_build_basic_command(self):
+    def test_build_basic_command(self, command_builder):
         """Test basic command building."""
         config = ClaudeConfig(auth_token="test")
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Hello world",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
             stream=False,
         )
@@ -32,12 +28,12 @@ class TestCommandBuilder:
         assert "--output-format" in cmd
         assert "json" in cmd
 
-    def test_build_stream_command(self):
+    def test_build_stream_command(self, command_builder):
         """Test streaming command building."""
         config = ClaudeConfig(auth_token="test")
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Hello world",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
             stream=True,
         )
@@ -45,128 +41,141 @@ class TestCommandBuilder:
         assert "stream-json" in cmd
         assert "--verbose" in cmd
 
-    def test_build_with_allowed_tools(self):
+    def test_build_with_allowed_tools(self, command_builder):
         """Test command with allowed tools."""
         config = ClaudeConfig(
             auth_token="test",
             allowed_tools=["Read", "Write"],
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
         )
 
-        assert "--allowedTools" in cmd
-        idx = cmd.index("--allowedTools")
-        assert cmd[idx + 1] == "Read,Write"
+        assert cmd.flags["--allowedTools"] == ["Read,Write"]
 
-    def test_build_with_bash_tool_restriction(self):
+    def test_build_with_bash_tool_restriction(self, command_builder):
         """Test Bash tool gets workspace restriction."""
         config = ClaudeConfig(
             auth_token="test",
             allowed_tools=["Bash"],
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
             workspace=Path("/my/workspace"),
             config=config,
         )
 
-        assert "--allowedTools" in cmd
-        idx = cmd.index("--allowedTools")
-        assert "Bash(/my/workspace/*)" in cmd[idx + 1]
+        assert "Bash(/my/workspace/*)" in cmd.flags["--allowedTools"][0]
 
-    def test_build_with_disallowed_tools(self):
+    def test_build_with_disallowed_tools(self, command_builder):
         """Test command with disallowed tools."""
         config = ClaudeConfig(
             auth_token="test",
             disallowed_tools=["Bash", "Edit"],
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
         )
 
-        assert "--disallowedTools" in cmd
-        idx = cmd.index("--disallowedTools")
-        assert cmd[idx + 1] == "Bash,Edit"
+        assert cmd.flags["--disallowedTools"] == ["Bash,Edit"]
 
-    def test_build_with_permission_mode(self):
+    def test_build_with_permission_mode(self, command_builder):
         """Test command with permission mode."""
         config = ClaudeConfig(
             auth_token="test",
             permission_mode="acceptEdits",
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
         )
 
-        assert "--permission-mode" in cmd
-        idx = cmd.index("--permission-mode")
-        assert cmd[idx + 1] == "acceptEdits"
+        assert cmd.flags["--permission-mode"] == ["acceptEdits"]
 
-    def test_build_default_permission_mode_not_added(self):
+    def test_build_default_permission_mode_not_added(self, command_builder):
         """Test default permission mode is not added."""
         config = ClaudeConfig(
             auth_token="test",
             permission_mode="default",
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
         )
 
-        assert "--permission-mode" not in cmd
+        assert "--permission-mode" not in cmd.flags
 
-    def test_build_with_model(self):
+    def test_build_with_model(self, command_builder):
         """Test command with model selection."""
         config = ClaudeConfig(
             auth_token="test",
             model="claude-opus-4-20250514",
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
         )
 
-        assert "--model" in cmd
-        idx = cmd.index("--model")
-        assert cmd[idx + 1] == "claude-opus-4-20250514"
+        assert cmd.flags["--model"] == ["claude-opus-4-20250514"]
 
-    def test_build_with_max_turns(self):
+    def test_build_with_max_turns(self, command_builder):
         """Test command with max turns."""
         config = ClaudeConfig(
             auth_token="test",
             max_turns=5,
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
         )
 
-        assert "--max-turns" in cmd
-        idx = cmd.index("--max-turns")
-        assert cmd[idx + 1] == "5"
+        assert cmd.flags["--max-turns"] == ["5"]
 
-    def test_build_with_add_dirs(self):
+    def test_build_with_add_dirs(self, command_builder):
         """Test command with additional directories."""
         config = ClaudeConfig(
             auth_token="test",
             add_dirs=["/dir1", "/dir2"],
         )
-        cmd = self.builder.build(
+        cmd = command_builder.build(
             task="Test",
-            workspace=self.workspace,
+            workspace=self.WORKSPACE,
             config=config,
         )
 
         assert cmd.count("--add-dir") == 2
-        assert "/dir1" in cmd
-        assert "/dir2" in cmd
+        assert cmd.flags["--add-dir"] == ["/dir1", "/dir2"]
+
+    def test_build_reflects_config_changes_between_calls(self, command_builder):
+        """Test cached arguments are not reused after config changes."""
+        config = ClaudeConfig(auth_token="test", model="model-a")
+        first = command_builder.build(task="Test", workspace=self.WORKSPACE, config=config)
+
+        config.model = "model-b"
+        second = command_builder.build(task="Test", workspace=self.WORKSPACE, config=config)
+
+        assert first.flags["--model"] == ["model-a"]
+        assert second.flags["--model"] == ["model-b"]
+
+    def test_build_flags_view_matches_argv(self, command_builder):
+        """Test flags view indexes the same arguments as the list."""
+        config = ClaudeConfig(auth_token="test")
+        cmd = command_builder.build(
+            task="Hello world",
+            workspace=self.WORKSPACE,
+            config=config,
+            stream=True,
+        )
+
+        assert isinstance(cmd, list)
+        assert cmd.flags["-p"] == ["Hello world"]
+        assert cmd.flags["--output-format"] == ["stream-json"]
+        assert cmd.flags["--verbose"] == []
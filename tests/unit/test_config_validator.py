@@ -3,18 +3,13 @@ Test Config Validator - Unit tests for ConfigValidator.
 """
 
 
-from ...infrastructure.config.config_validator import ConfigValidator
 from ...models import ClaudeConfig
 
 
 class TestConfigValidator:
     """Tests for ConfigValidator."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = ConfigValidator()
-
-    def test_validate_valid_config_with_auth_token(self):
+    def test_validate_valid_config_with_auth_token(self, config_validator):
         """Test validation passes with auth token."""
         config = ClaudeConfig(
             auth_token="test-token",
@@ -22,12 +17,12 @@ class TestConfigValidator:
             timeout_seconds=120,
         )
 
-        result = self.validator.validate(config)
+        result = config_validator.validate(config)
 
         assert result.is_ok()
         assert result.unwrap() == config
 
-    def test_validate_valid_config_with_api_key(self):
+    def test_validate_valid_config_with_api_key(self, config_validator):
         """Test validation passes with API key."""
         config = ClaudeConfig(
             api_key="sk-test-key",
@@ -35,11 +30,11 @@ class TestConfigValidator:
             timeout_seconds=120,
         )
 
-        result = self.validator.validate(config)
+        result = config_validator.validate(config)
 
         assert result.is_ok()
 
-    def test_validate_missing_auth(self):
+    def test_validate_missing_auth(self, config_validator):
         """Test validation fails without auth."""
         config = ClaudeConfig(
             auth_token="",
@@ -48,13 +43,13 @@ class TestConfigValidator:
             timeout_seconds=120,
         )
 
-        result = self.validator.validate(config)
+        result = config_validator.validate(config)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.field == "auth"
 
-    def test_validate_invalid_permission_mode(self):
+    def test_validate_invalid_permission_mode(self, config_validator):
         """Test validation fails with invalid permission mode."""
         config = ClaudeConfig(
             auth_token="test-token",
@@ -62,13 +57,13 @@ class TestConfigValidator:
             timeout_seconds=120,
         )
 
-        result = self.validator.validate(config)
+        result = config_validator.validate(config)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.field == "permission_mode"
 
-    def test_validate_all_permission_modes(self):
+    def test_validate_all_permission_modes(self, config_validator):
         """Test all valid permission modes pass."""
         valid_modes = ["default", "acceptEdits", "plan", "dontAsk"]
 
@@ -78,10 +73,17 @@ class TestConfigValidator:
                 permission_mode=mode,
                 timeout_seconds=120,
             )
-            result = self.validator.validate(config)
+            result = config_validator.validate(config)
             assert result.is_ok(), f"Mode {mode} should be valid"
 
-    def test_validate_timeout_too_low(self):
+    def test_permission_modes_keep_declared_order(self, config_validator):
+        """Test the public mode list is an ordered, indexable sequence."""
+        modes = config_validator.VALID_PERMISSION_MODES
+
+        assert modes == ("default", "acceptEdits", "plan", "dontAsk")
+        assert modes[0] == "default"
+
+    def test_validate_timeout_too_low(self, config_validator):
         """Test validation fails with timeout too low."""
         config = ClaudeConfig(
             auth_token="test-token",
@@ -89,13 +91,13 @@ class TestConfigValidator:
             timeout_seconds=5,  # Below minimum of 10
         )
 
-        result = self.validator.validate(config)
+        result = config_validator.validate(config)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.field == "timeout_seconds"
 
-    def test_validate_timeout_too_high(self):
+    def test_validate_timeout_too_high(self, config_validator):
         """Test validation fails with timeout too high."""
         config = ClaudeConfig(
             auth_token="test-token",
@@ -103,13 +105,13 @@ class TestConfigValidator:
             timeout_seconds=1000,  # Above maximum of 600
         )
 
-        result = self.validator.validate(config)
+        result = config_validator.validate(config)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.field == "timeout_seconds"
 
-    def test_validate_timeout_at_boundaries(self):
+    def test_validate_timeout_at_boundaries(self, config_validator):
         """Test validation passes at timeout boundaries."""
         # Minimum boundary
         config_min = ClaudeConfig(
@@ -117,7 +119,7 @@ class TestConfigValidator:
             permission_mode="default",
             timeout_seconds=10,
         )
-        assert self.validator.validate(config_min).is_ok()
+        assert config_validator.validate(config_min).is_ok()
 
         # Maximum boundary
         config_max = ClaudeConfig(
@@ -125,4 +127,4 @@ class TestConfigValidator:
             permission_mode="default",
             timeout_seconds=600,
         )
-        assert self.validator.validate(config_max).is_ok()
+        assert config_validator.validate(config_max).is_ok()
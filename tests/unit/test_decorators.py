@@ -0,0 +1,223 @@
+"""
+Test Decorators - Unit tests for AOP decorators.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from ...utils.decorators import _format_args, _retry_delay, log_entry_exit, retry, with_timeout
+
+
+@log_entry_exit
+def _add(a, b):
+    return a + b
+
+
+@log_entry_exit
+async def _async_fail():
+    raise ValueError("boom")
+
+
+class TestLogEntryExit:
+    """Tests for log_entry_exit."""
+
+    def test_logs_entry_and_exit_when_info_enabled(self, caplog):
+        """Test entry and exit lines are emitted at INFO."""
+        with caplog.at_level(logging.INFO, logger="astrbot"):
+            assert _add(1, 2) == 3
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages[0].startswith("[ENTRY] _add")
+        assert messages[1].startswith("[EXIT] _add duration_ms=")
+
+    def test_logs_all_arguments_of_plain_functions(self, caplog):
+        """Test the first positional argument is kept for non-methods."""
+        with caplog.at_level(logging.INFO, logger="astrbot"):
+            _add(1, 2)
+
+        assert caplog.records[0].getMessage() == "[ENTRY] _add inputs={1, 2}"
+
+    def test_skips_self_for_methods(self, caplog):
+        """Test self is omitted from method argument previews."""
+        class Greeter:
+            @log_entry_exit
+            def greet(self, name):
+                return f"hi {name}"
+
+        with caplog.at_level(logging.INFO, logger="astrbot"):
+            Greeter().greet("bob")
+
+        assert caplog.records[0].getMessage().endswith("greet inputs={bob}")
+
+    def test_skips_info_logging_when_disabled(self, caplog):
+        """Test nothing is logged for successful calls above INFO."""
+        with caplog.at_level(logging.WARNING, logger="astrbot"):
+            assert _add(1, 2) == 3
+
+        assert caplog.records == []
+
+    def test_logs_error_when_info_disabled(self, caplog):
+        """Test failures are still logged when INFO is disabled."""
+        with caplog.at_level(logging.WARNING, logger="astrbot"):
+            with pytest.raises(ValueError):
+                asyncio.run(_async_fail())
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage().startswith("[ERROR] _async_fail ValueError: boom")
+
+    def test_sample_rate_logs_every_nth_call(self, caplog):
+        """Test sampled decorator logs one call in every 1/sample_rate."""
+        @log_entry_exit(sample_rate=0.25)
+        def ping():
+            return "pong"
+
+        with caplog.at_level(logging.INFO, logger="astrbot"):
+            for _ in range(8):
+                assert ping() == "pong"
+
+        entries = [r for r in caplog.records if r.getMessage().startswith("[ENTRY]")]
+        assert len(entries) == 2
+
+    def test_sampled_out_calls_still_log_errors(self, caplog):
+        """Test failures are logged even when the call is not sampled."""
+        @log_entry_exit(sample_rate=0.5)
+        def fail():
+            raise ValueError("boom")
+
+        with caplog.at_level(logging.INFO, logger="astrbot"):
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    fail()
+
+        errors = [r for r in caplog.records if r.levelno == logging.ERROR]
+        assert len(errors) == 2
+
+    def test_invalid_sample_rate_rejected(self):
+        """Test sample_rate outside (0, 1] raises ValueError."""
+        with pytest.raises(ValueError):
+            log_entry_exit(sample_rate=0)
+
+    def test_preserves_metadata(self):
+        """Test functools.wraps keeps the wrapped function's name."""
+        assert _add.__name__ == "_add"
+        assert _add.__wrapped__(2, 3) == 5
+
+
+class TestWithTimeout:
+    """Tests for with_timeout."""
+
+    def test_returns_result_within_timeout(self):
+        """Test result passes through when the call finishes in time."""
+        @with_timeout(5)
+        async def quick():
+            return "done"
+
+        assert asyncio.run(quick()) == "done"
+
+    def test_raises_timeout_error(self):
+        """Test per-call timeout override raises TimeoutError."""
+        @with_timeout(5)
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(slow(timeout=0.01))
+
+
+class TestFormatArgs:
+    """Tests for _format_args."""
+
+    def test_truncates_long_strings(self):
+        """Test long string arguments are cut at max_len."""
+        result = _format_args(("self", "x" * 100), {}, skip_self=True)
+
+        assert result == f"inputs={{{'x' * 50}...}}"
+
+    def test_summarizes_bytes(self):
+        """Test bytes arguments are summarized rather than rendered."""
+        result = _format_args((), {"payload": b"\0" * 10_000_000})
+
+        assert result == "inputs={payload=<bytes len=10000000>}"
+
+    def test_bounds_large_containers(self):
+        """Test containers are truncated while rendering."""
+        result = _format_args((), {"items": list(range(100_000))})
+
+        assert len(result) < 100
+
+
+class TestRetry:
+    """Tests for retry."""
+
+    def test_retries_until_success(self):
+        """Test failing calls are retried until one succeeds."""
+        calls = []
+
+        @retry(max_attempts=3, delay=0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ValueError("transient")
+            return "ok"
+
+        assert flaky() == "ok"
+        assert len(calls) == 3
+
+    def test_giveup_stops_immediately(self):
+        """Test giveup predicate re-raises without further attempts."""
+        calls = []
+
+        @retry(max_attempts=5, delay=0, giveup=lambda e: isinstance(e, KeyError))
+        async def fatal():
+            calls.append(1)
+            raise KeyError("permanent")
+
+        with pytest.raises(KeyError):
+            asyncio.run(fatal())
+        assert len(calls) == 1
+
+    def test_failures_are_logged(self, caplog):
+        """Test retry warnings and the final error carry name and attempt counts."""
+        @retry(max_attempts=2, delay=0)
+        def broken():
+            raise ValueError("down")
+
+        with caplog.at_level(logging.WARNING, logger="astrbot"), pytest.raises(ValueError):
+            broken()
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("attempt 1/2 failed: down" in m and "broken" in m for m in messages)
+        assert any(m.endswith("all 2 attempts failed") for m in messages)
+
+    def test_cancellation_is_not_retried(self):
+        """Test CancelledError propagates even when BaseException is caught."""
+        calls = []
+
+        @retry(max_attempts=5, delay=0, exceptions=(BaseException,))
+        async def cancelled():
+            calls.append(1)
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancelled())
+        assert len(calls) == 1
+
+    def test_single_attempt_returns_function_unwrapped(self):
+        """Test max_attempts=1 skips the retry wrapper entirely."""
+        def once():
+            return "ok"
+
+        assert retry(max_attempts=1)(once) is once
+
+    def test_delay_grows_exponentially_and_is_capped(self):
+        """Test backoff doubles per attempt up to max_delay."""
+        delays = [_retry_delay(n, 1.0, 2.0, 5.0, 0.0) for n in range(1, 6)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_stays_within_bounds(self):
+        """Test jittered delays stay within the relative spread."""
+        for _ in range(100):
+            assert 0.9 <= _retry_delay(1, 1.0, 2.0, 30.0, 0.1) <= 1.1
@@ -0,0 +1,53 @@
+"""
+Test Log Queue - Unit tests for queued logging setup.
+"""
+
+import logging
+from logging.handlers import QueueHandler
+
+from ...utils.log_queue import install_queue_logging, uninstall_queue_logging
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestQueueLogging:
+    """Tests for install_queue_logging / uninstall_queue_logging."""
+
+    def setup_method(self):
+        """Use an isolated logger with one capturing handler."""
+        self.logger = logging.getLogger("test.log_queue")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.handler = _ListHandler()
+        self.logger.handlers = [self.handler]
+
+    def teardown_method(self):
+        """Always restore handlers."""
+        uninstall_queue_logging(self.logger)
+        self.logger.handlers = []
+
+    def test_records_delivered_through_queue(self):
+        """Test records reach the original handler via the listener."""
+        assert install_queue_logging(self.logger) is True
+        assert self.handler not in self.logger.handlers
+
+        self.logger.info("hello %s", "queue")
+        uninstall_queue_logging(self.logger)
+
+        assert self.handler.messages == ["hello queue"]
+        assert self.handler in self.logger.handlers
+        assert not any(isinstance(h, QueueHandler) for h in self.logger.handlers)
+
+    def test_no_handlers_is_noop(self):
+        """Test loggers without handlers are left untouched."""
+        self.logger.handlers = []
+
+        assert install_queue_logging(self.logger) is False
+        assert self.logger.handlers == []
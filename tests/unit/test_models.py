@@ -0,0 +1,43 @@
+"""
+Test Models - Unit tests for the shared result and error types.
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from ...domain.errors import FrozenMap
+from ...models import ChunkType, ErrorCode, ExecutionError, ExecutionResult, StreamChunk
+
+
+class TestFrozenMap:
+    """Tests for FrozenMap."""
+
+    def test_is_read_only(self):
+        """Test items cannot be assigned."""
+        frozen = FrozenMap({"a": 1})
+
+        with pytest.raises(TypeError):
+            frozen["b"] = 2
+        assert frozen == {"a": 1}
+
+
+class TestSerialization:
+    """Tests that model instances survive pickle, deepcopy and asdict."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            ExecutionResult(output="done"),
+            ExecutionResult(output="done", metadata=FrozenMap({"k": "v"})),
+            StreamChunk(ChunkType.STATUS, "line"),
+            ExecutionError(ErrorCode.TIMEOUT, "slow"),
+        ],
+    )
+    def test_round_trip(self, value):
+        """Test default and populated read-only mappings round-trip."""
+        assert pickle.loads(pickle.dumps(value)) == value
+        assert copy.deepcopy(value) == value
+        assert isinstance(dataclasses.asdict(value), dict)
@@ -4,18 +4,13 @@ Test Output Parser - Unit tests for OutputParser.
 
 import json
 
-from ...infrastructure.process.output_parser import OutputParser
 from ...models import ErrorCode
 
 
 class TestOutputParser:
     """Tests for OutputParser."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = OutputParser()
-
-    def test_parse_success_output(self):
+    def test_parse_success_output(self, output_parser):
         """Test parsing successful output."""
         stdout = json.dumps({
             "result": "Task completed",
@@ -24,7 +19,7 @@ class TestOutputParser:
             "session_id": "sess-123",
         })
 
-        result = self.parser.parse(stdout, "", 1000.0)
+        result = output_parser.parse(stdout, "", 1000.0)
 
         assert result.is_ok()
         exec_result = result.unwrap()
@@ -33,7 +28,7 @@ class TestOutputParser:
         assert exec_result.session_id == "sess-123"
         assert exec_result.duration_ms == 1000.0
 
-    def test_parse_error_output(self):
+    def test_parse_error_output(self, output_parser):
         """Test parsing error output."""
         stdout = json.dumps({
             "result": "Permission denied",
@@ -42,48 +37,48 @@ class TestOutputParser:
             "session_id": "sess-456",
         })
 
-        result = self.parser.parse(stdout, "", 500.0)
+        result = output_parser.parse(stdout, "", 500.0)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.code == ErrorCode.CLI_ERROR
         assert "Permission denied" in error.message
 
-    def test_parse_malformed_json_with_stderr_error(self):
+    def test_parse_malformed_json_with_stderr_error(self, output_parser):
         """Test parsing malformed JSON with error in stderr."""
         stdout = "Not valid JSON"
         stderr = "Error: something failed"
 
-        result = self.parser.parse(stdout, stderr, 100.0)
+        result = output_parser.parse(stdout, stderr, 100.0)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.code == ErrorCode.PARSE_ERROR
 
-    def test_parse_malformed_json_fallback(self):
+    def test_parse_malformed_json_fallback(self, output_parser):
         """Test parsing malformed JSON falls back to raw output."""
         stdout = "Raw output without JSON"
         stderr = ""
 
-        result = self.parser.parse(stdout, stderr, 100.0)
+        result = output_parser.parse(stdout, stderr, 100.0)
 
         assert result.is_ok()
         exec_result = result.unwrap()
         assert exec_result.output == "Raw output without JSON"
         assert exec_result.cost_usd == 0.0
 
-    def test_parse_empty_output_with_error(self):
+    def test_parse_empty_output_with_error(self, output_parser):
         """Test parsing empty output with error indicator."""
         stdout = ""
         stderr = "Error occurred"
 
-        result = self.parser.parse(stdout, stderr, 100.0)
+        result = output_parser.parse(stdout, stderr, 100.0)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.code == ErrorCode.PARSE_ERROR
 
-    def test_parse_preserves_metadata(self):
+    def test_parse_preserves_metadata(self, output_parser):
         """Test that raw data is preserved in metadata."""
         data = {
             "result": "Done",
@@ -94,33 +89,56 @@ class TestOutputParser:
         }
         stdout = json.dumps(data)
 
-        result = self.parser.parse(stdout, "", 200.0)
+        result = output_parser.parse(stdout, "", 200.0)
 
         assert result.is_ok()
         exec_result = result.unwrap()
         assert "raw_data" in exec_result.metadata
         assert exec_result.metadata["raw_data"]["extra_field"] == "extra_value"
 
-    def test_parse_nonzero_returncode_treated_as_error(self):
+    def test_parse_nonzero_returncode_treated_as_error(self, output_parser):
         """Test non-zero returncode yields error even if JSON says success."""
         stdout = json.dumps({
             "result": "Task completed",
             "is_error": False,
         })
 
-        result = self.parser.parse(stdout, "", 1000.0, returncode=1)
+        result = output_parser.parse(stdout, "", 1000.0, returncode=1)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.code == ErrorCode.CLI_ERROR
 
-    def test_parse_malformed_json_with_nonzero_returncode(self):
+    def test_parse_malformed_json_with_nonzero_returncode(self, output_parser):
         """Test malformed JSON with non-zero returncode returns parse error."""
         stdout = "Not valid JSON"
         stderr = "Some stderr"
 
-        result = self.parser.parse(stdout, stderr, 100.0, returncode=2)
+        result = output_parser.parse(stdout, stderr, 100.0, returncode=2)
 
         assert result.is_err()
         error = result.unwrap_err()
         assert error.code == ErrorCode.PARSE_ERROR
+
+    def test_parse_repeated_calls_keep_results_independent(self, output_parser):
+        """Test consecutive parses (shared parser state) return correct data."""
+        first = output_parser.parse(
+            json.dumps({"result": "one", "nested": {"a": 1}}), "", 10.0
+        ).unwrap()
+        second = output_parser.parse(
+            json.dumps({"result": "two", "nested": {"a": 2}}), "", 10.0
+        ).unwrap()
+
+        assert first.output == "one"
+        assert second.output == "two"
+        assert first.metadata["raw_data"]["nested"] == {"a": 1}
+        assert second.metadata["raw_data"]["nested"] == {"a": 2}
+
+    def test_parse_nested_result_value(self, output_parser):
+        """Test non-string result value is handled."""
+        stdout = json.dumps({"result": {"text": "Done"}, "is_error": False})
+
+        result = output_parser.parse(stdout, "", 10.0)
+
+        assert result.is_ok()
+        assert result.unwrap().metadata["raw_data"]["result"] == {"text": "Done"}
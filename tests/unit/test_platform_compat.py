@@ -0,0 +1,265 @@
+"""
+Test Platform Compat - Unit tests for cross-platform utilities.
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+import uuid
+
+import pytest
+
+from ...utils import platform_compat
+from ...utils.platform_compat import (
+    is_process_running,
+    is_process_running_fast,
+    resolve_command,
+    start_background_process,
+    terminate_process,
+)
+
+
+def _make_executable(directory, name):
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+    return path
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bits")
+class TestResolveCommand:
+    """Tests for resolve_command."""
+
+    def setup_method(self):
+        """Start each test with an empty lookup cache."""
+        platform_compat._WHICH_CACHE.clear()
+
+    def test_resolves_from_path(self, tmp_path, monkeypatch):
+        """Test command is resolved to its full path."""
+        exe = _make_executable(tmp_path, "fake-cli")
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert resolve_command("fake-cli") == str(exe)
+
+    def test_missing_command_is_returned_unchanged(self, tmp_path, monkeypatch):
+        """Test unresolvable commands fall back to the bare name."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert resolve_command("fake-cli") == "fake-cli"
+
+    def test_miss_is_not_cached(self, tmp_path, monkeypatch):
+        """Test a command installed after a failed lookup is found."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert resolve_command("fake-cli") == "fake-cli"
+
+        exe = _make_executable(tmp_path, "fake-cli")
+
+        assert resolve_command("fake-cli") == str(exe)
+
+    def test_path_change_invalidates_cache(self, tmp_path, monkeypatch):
+        """Test a changed PATH triggers a fresh lookup."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        _make_executable(first, "fake-cli")
+        exe = _make_executable(second, "fake-cli")
+
+        monkeypatch.setenv("PATH", str(first))
+        resolve_command("fake-cli")
+        monkeypatch.setenv("PATH", os.pathsep.join([str(second), str(first)]))
+
+        assert resolve_command("fake-cli") == str(exe)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc scan is Linux-only")
+class TestProcScan:
+    """Tests for the /proc process scan."""
+
+    def test_finds_process_by_joined_arguments(self):
+        """Test pattern spanning several arguments matches a live process."""
+        marker = f"proc-scan-marker-{os.getpid()}"
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; print(flush=True); time.sleep(30)", marker, "8080"],
+            stdout=subprocess.PIPE,
+        )
+        try:
+            # Wait until the child has exec'd and its cmdline is final
+            proc.stdout.readline()
+            assert platform_compat._is_process_running_proc(f"{marker} 8080") is True
+        finally:
+            proc.kill()
+            proc.wait()
+            proc.stdout.close()
+
+    def test_missing_process_not_found(self):
+        """Test pattern with no matching process returns False."""
+        marker = f"absent-{uuid.uuid4().hex}"
+
+        assert platform_compat._is_process_running_proc(marker) is False
+
+
+class _FakePsutil:
+    """process_iter stand-in yielding fixed cmdlines."""
+
+    def __init__(self, cmdlines):
+        self._cmdlines = cmdlines
+
+    def process_iter(self, attrs):
+        for cmdline in self._cmdlines:
+            yield type("Proc", (), {"info": {"cmdline": cmdline}})()
+
+
+class TestPsutilScan:
+    """Tests for the psutil process scan."""
+
+    def test_matches_joined_arguments(self, monkeypatch):
+        """Test pattern spanning arguments matches; denied entries are skipped."""
+        fake = _FakePsutil([None, ["python", "-m", "server", "--port", "8080"]])
+        monkeypatch.setattr(platform_compat, "psutil", fake)
+
+        assert platform_compat._is_process_running_psutil("server --port 8080") is True
+        assert platform_compat._is_process_running_psutil("other") is False
+
+    def test_scan_prefers_psutil(self, monkeypatch):
+        """Test the cached scan uses psutil when it is available."""
+        pattern = f"psutil-only-{uuid.uuid4().hex}"
+        monkeypatch.setattr(platform_compat, "psutil", _FakePsutil([[pattern]]))
+
+        try:
+            assert asyncio.run(is_process_running(pattern)) is True
+        finally:
+            platform_compat._scan_cache.pop(pattern, None)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="PID probe is POSIX-only")
+class TestManagedProcesses:
+    """Tests for the managed PID registry."""
+
+    def test_registered_process_tracked_until_exit(self, tmp_path):
+        """Test keyed process is reported alive, then dropped after exit."""
+        key = f"managed-{uuid.uuid4().hex}"
+        pid = asyncio.run(
+            start_background_process(
+                [sys.executable, "-c", "import time; time.sleep(30)"], tmp_path, key=key
+            )
+        )
+        try:
+            assert is_process_running_fast(key) is True
+        finally:
+            os.kill(pid, signal.SIGKILL)
+
+        deadline = time.monotonic() + 5
+        while is_process_running_fast(key) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert is_process_running_fast(key) is False
+        assert key not in platform_compat._managed_pids
+        assert pid not in platform_compat._procs
+
+    def test_terminate_escalates_to_kill(self, tmp_path, monkeypatch):
+        """Test a process ignoring SIGTERM is killed and reaped."""
+        monkeypatch.setattr(platform_compat, "_TERMINATE_TIMEOUT", 0.2)
+        ready = tmp_path / "ready"
+        code = (
+            "import pathlib, signal, sys, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+            "pathlib.Path(sys.argv[1]).touch(); time.sleep(30)"
+        )
+        pid = asyncio.run(
+            start_background_process([sys.executable, "-c", code, str(ready)], tmp_path)
+        )
+        proc = platform_compat._procs[pid]
+        deadline = time.monotonic() + 5
+        while not ready.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert asyncio.run(terminate_process(pid)) is True
+        assert proc.returncode == -signal.SIGKILL
+        assert pid not in platform_compat._procs
+
+    def test_unknown_key_not_running(self):
+        """Test unregistered keys are reported as not running."""
+        assert is_process_running_fast(f"unknown-{uuid.uuid4().hex}") is False
+
+
+class TestTerminateWindows:
+    """Tests for the Windows branch of terminate_process."""
+
+    def test_slow_reap_after_tree_kill_is_success(self, monkeypatch):
+        """Test a wait timeout after a successful tree kill still reports True."""
+        class SlowProc:
+            def wait(self, timeout=None):
+                raise subprocess.TimeoutExpired("child", timeout)
+
+        monkeypatch.setattr(platform_compat.sys, "platform", "win32")
+        monkeypatch.setattr(platform_compat, "_terminate_tree_windows", lambda pid: True)
+
+        assert platform_compat._terminate_process_sync(12345, SlowProc()) is True
+
+
+class TestCaseInsensitiveBytesRegex:
+    """Tests for _ci_bytes_regex."""
+
+    def test_matches_raw_output_ignoring_case(self):
+        """Test literal pattern matches undecoded output in any case."""
+        output = b"C:\\Python\\PYTHON.EXE -m HTTP.SERVER 8080 --bind 0.0.0.0\r\n"
+
+        assert platform_compat._ci_bytes_regex("http.server 8080").search(output)
+
+    def test_pattern_is_literal(self):
+        """Test regex metacharacters in the pattern are escaped."""
+        assert platform_compat._ci_bytes_regex("http.server").search(b"httpxserver") is None
+
+
+class TestScanCache:
+    """Tests for is_process_running scan caching and coalescing."""
+
+    def setup_method(self):
+        """Start each test with no cached scans."""
+        platform_compat._scan_cache.clear()
+
+    def _count_scans(self, monkeypatch, result=False):
+        calls = []
+
+        async def fake_scan(pattern):
+            calls.append(pattern)
+            await asyncio.sleep(0.01)
+            return result
+
+        # Force the platform branch even when psutil is installed
+        monkeypatch.setattr(platform_compat, "psutil", None)
+        monkeypatch.setattr(platform_compat, "_is_process_running_unix", fake_scan)
+        monkeypatch.setattr(platform_compat, "_is_process_running_windows", fake_scan)
+        return calls
+
+    def test_concurrent_callers_share_one_scan(self, monkeypatch):
+        """Test simultaneous checks for one pattern run a single scan."""
+        calls = self._count_scans(monkeypatch, result=True)
+
+        async def go():
+            return await asyncio.gather(*(is_process_running("pat") for _ in range(5)))
+
+        assert asyncio.run(go()) == [True] * 5
+        assert calls == ["pat"]
+
+    def test_result_cached_within_ttl(self, monkeypatch):
+        """Test a repeated check inside the TTL reuses the last scan."""
+        calls = self._count_scans(monkeypatch)
+
+        asyncio.run(is_process_running("pat"))
+        asyncio.run(is_process_running("pat"))
+
+        assert calls == ["pat"]
+
+    def test_expired_result_rescanned(self, monkeypatch):
+        """Test a check after the TTL runs a fresh scan."""
+        calls = self._count_scans(monkeypatch)
+        monkeypatch.setattr(platform_compat, "_SCAN_TTL", 0.0)
+
+        asyncio.run(is_process_running("pat"))
+        asyncio.run(is_process_running("pat"))
+
+        assert calls == ["pat", "pat"]
+
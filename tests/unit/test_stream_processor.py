@@ -0,0 +1,126 @@
+"""
+Test Stream Processor - Unit tests for StreamProcessor.
+"""
+
+import asyncio
+import json
+import time
+
+from ...infrastructure.stream.stream_processor import StreamProcessor, _read_line_batches
+from ...models import ErrorCode
+from ..fixtures.sample_outputs import SAMPLE_OUTPUTS_BYTES
+
+
+class FakeProcess:
+    """Minimal subprocess stand-in backed by StreamReaders."""
+
+    def __init__(self, stdout_parts: list[bytes], stderr: bytes = b"", returncode: int = 0):
+        self.stdout = asyncio.StreamReader()
+        for part in stdout_parts:
+            self.stdout.feed_data(part)
+        self.stdout.feed_eof()
+
+        self.stderr = asyncio.StreamReader()
+        self.stderr.feed_data(stderr)
+        self.stderr.feed_eof()
+
+        self.returncode = returncode
+
+    async def wait(self) -> int:
+        return self.returncode
+
+
+def _run(stdout_parts: list[bytes], returncode: int = 0, on_progress=None):
+    async def go():
+        proc = FakeProcess(stdout_parts, returncode=returncode)
+        return await StreamProcessor().process(proc, on_progress, time.time())
+
+    return asyncio.run(go())
+
+
+class TestStreamProcessor:
+    """Tests for StreamProcessor."""
+
+    def test_process_accumulates_content(self):
+        """Test content of all chunks is accumulated in order."""
+        lines = [
+            json.dumps({"type": "thinking", "content": "Analyzing"}),
+            json.dumps({"type": "result", "content": "Done"}),
+        ]
+
+        result = _run([("\n".join(lines) + "\n").encode("utf-8")])
+
+        assert result.is_ok()
+        assert result.unwrap().output == "Analyzing\nDone"
+        assert result.unwrap().metadata["chunk_count"] == 2
+
+    def test_process_sample_stream_bytes(self):
+        """Test the recorded CLI stream, fed as raw bytes, parses end to end."""
+        chunks = SAMPLE_OUTPUTS_BYTES["stream_chunks"]
+
+        result = _run([b"\n".join(chunks) + b"\n"])
+
+        assert result.is_ok()
+        assert result.unwrap().metadata["chunk_count"] == len(chunks)
+        assert result.unwrap().output.endswith("Task completed successfully")
+
+    def test_process_invokes_callback(self):
+        """Test progress callback receives every chunk."""
+        received = []
+        line = json.dumps({"type": "tool_use", "content": "Reading"}) + "\n"
+
+        result = _run([line.encode("utf-8")], on_progress=received.append)
+
+        assert result.is_ok()
+        assert [c.content for c in received] == ["Reading"]
+
+    def test_process_multibyte_split_across_reads(self):
+        """Test UTF-8 characters split between reads decode correctly."""
+        data = (json.dumps({"content": "你好"}, ensure_ascii=False) + "\n").encode("utf-8")
+        split = data.index("你".encode("utf-8")) + 1
+
+        result = _run([data[:split], data[split:]])
+
+        assert result.is_ok()
+        assert result.unwrap().output == "你好"
+
+    def test_process_line_longer_than_read_size(self):
+        """Test lines larger than the reader limit are not rejected."""
+        content = "x" * (200 * 1024)
+        data = (json.dumps({"type": "result", "content": content}) + "\n").encode("utf-8")
+
+        result = _run([data])
+
+        assert result.is_ok()
+        assert result.unwrap().output == content
+
+    def test_process_error_chunk(self):
+        """Test error chunk produces CLI_ERROR."""
+        line = json.dumps({"type": "error", "content": "boom"}) + "\n"
+
+        result = _run([line.encode("utf-8")])
+
+        assert result.is_err()
+        assert result.unwrap_err().code == ErrorCode.CLI_ERROR
+        assert result.unwrap_err().message == "boom"
+
+    def test_process_nonzero_returncode(self):
+        """Test non-zero exit code produces CLI_ERROR."""
+        result = _run([b"raw output\n"], returncode=1)
+
+        assert result.is_err()
+        assert result.unwrap_err().details["returncode"] == 1
+
+
+class TestReadLineBatches:
+    """Tests for _read_line_batches."""
+
+    def test_trailing_line_without_newline(self):
+        """Test final unterminated line is yielded at EOF."""
+        async def go():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"a\nb\nc")
+            reader.feed_eof()
+            return [line async for batch in _read_line_batches(reader, 2) for line in batch]
+
+        assert asyncio.run(go()) == ["a", "b", "c"]
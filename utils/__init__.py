@@ -3,19 +3,29 @@ Utils Layer - Cross-cutting concerns and utilities.
 """
 
 from .decorators import log_entry_exit, retry, with_timeout
+from .log_queue import install_queue_logging, uninstall_queue_logging
 from .platform_compat import (
+    ensure_dir,
     is_process_running,
+    is_process_running_fast,
     resolve_command,
     start_background_process,
     terminate_process,
 )
+from .serialization import JSONDecodeError, json_loads
 
 __all__ = [
     "log_entry_exit",
     "with_timeout",
     "retry",
     "is_process_running",
+    "is_process_running_fast",
     "start_background_process",
     "terminate_process",
     "resolve_command",
+    "ensure_dir",
+    "install_queue_logging",
+    "uninstall_queue_logging",
+    "json_loads",
+    "JSONDecodeError",
 ]
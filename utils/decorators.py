@@ -6,62 +6,139 @@ Provides logging, timeout, and retry functionality without polluting business lo
 
 import asyncio
 import functools
+import inspect
+import itertools
 import logging
+import random
+import reprlib
 import time
 from collections.abc import Callable
 from typing import Any, TypeVar
 
 logger = logging.getLogger("astrbot")
 
+# Bound once; both are called on every wrapped invocation
+_is_enabled = logger.isEnabledFor
+_pc = time.perf_counter_ns
+
+# asyncio.timeout() is Python 3.11+; older interpreters use asyncio.wait_for
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def log_entry_exit(func: F) -> F:
+def log_entry_exit(func: F | None = None, *, sample_rate: float = 1.0):
     """
     Decorator to log function entry and exit.
 
     Supports both sync and async functions.
-    Logs function name, arguments (truncated), and duration.
+    Logs function name, arguments (truncated), and duration. When INFO is
+    disabled for the logger, or the call is not sampled, only failures are
+    logged and arguments are never formatted.
+
+    Args:
+        func: Function to wrap (when used as a bare decorator)
+        sample_rate: Fraction of calls whose entry/exit is logged, in (0, 1]
+
+    Usage:
+        @log_entry_exit
+        def my_func(): ...
+
+        @log_entry_exit(sample_rate=0.01)
+        async def hot_func(): ...
     """
+    if not 0 < sample_rate <= 1:
+        raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}")
+    if func is None:
+        return functools.partial(log_entry_exit, sample_rate=sample_rate)
+
+    # Log every stride-th call; stride 1 logs all calls
+    stride = max(1, round(1 / sample_rate))
+    if asyncio.iscoroutinefunction(func):
+        return _log_async(func, stride)
+    return _log_sync(func, stride)
+
+
+def _log_async(func: Callable, stride: int) -> Callable:
+    """Build the logging wrapper for a coroutine function."""
+    # Resolved once per decoration; the wrapper reads them as closure cells
+    counter = itertools.count()
+    func_name = func.__qualname__
+    skip_self = _takes_self(func)
+    is_enabled = _is_enabled
+    info = logger.info
+    log_error = _log_error
+    pc = _pc
+
     @functools.wraps(func)
     async def async_wrapper(*args, **kwargs):
-        func_name = func.__qualname__
-        args_preview = _format_args(args, kwargs)
-        logger.info(f"[ENTRY] {func_name} {args_preview}")
-        start_time = time.time()
+        if not is_enabled(logging.INFO) or (stride > 1 and next(counter) % stride):
+            start_ns = pc()
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                log_error(func_name, e, start_ns)
+                raise
+
+        info("[ENTRY] %s %s", func_name, _format_args(args, kwargs, skip_self=skip_self))
+        start_ns = pc()
 
         try:
             result = await func(*args, **kwargs)
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(f"[EXIT] {func_name} duration_ms={duration_ms:.2f}")
+            info("[EXIT] %s duration_ms=%.2f", func_name, (pc() - start_ns) / 1_000_000)
             return result
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"[ERROR] {func_name} {type(e).__name__}: {e} duration_ms={duration_ms:.2f}")
+            log_error(func_name, e, start_ns)
             raise
 
+    return async_wrapper
+
+
+def _log_sync(func: Callable, stride: int) -> Callable:
+    """Build the logging wrapper for a regular function."""
+    counter = itertools.count()
+    func_name = func.__qualname__
+    skip_self = _takes_self(func)
+    is_enabled = _is_enabled
+    info = logger.info
+    log_error = _log_error
+    pc = _pc
+
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
-        func_name = func.__qualname__
-        args_preview = _format_args(args, kwargs)
-        logger.info(f"[ENTRY] {func_name} {args_preview}")
-        start_time = time.time()
+        if not is_enabled(logging.INFO) or (stride > 1 and next(counter) % stride):
+            start_ns = pc()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                log_error(func_name, e, start_ns)
+                raise
+
+        info("[ENTRY] %s %s", func_name, _format_args(args, kwargs, skip_self=skip_self))
+        start_ns = pc()
 
         try:
             result = func(*args, **kwargs)
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(f"[EXIT] {func_name} duration_ms={duration_ms:.2f}")
+            info("[EXIT] %s duration_ms=%.2f", func_name, (pc() - start_ns) / 1_000_000)
             return result
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"[ERROR] {func_name} {type(e).__name__}: {e} duration_ms={duration_ms:.2f}")
+            log_error(func_name, e, start_ns)
             raise
 
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
     return sync_wrapper
 
 
+def _log_error(func_name: str, exc: Exception, start_ns: int) -> None:
+    """Log a failed call with its duration."""
+    logger.error(
+        "[ERROR] %s %s: %s duration_ms=%.2f",
+        func_name,
+        type(exc).__name__,
+        exc,
+        (_pc() - start_ns) / 1_000_000,
+    )
+
+
 def with_timeout(default_timeout: int = 300):
     """
     Decorator to add timeout to async functions.
@@ -79,10 +156,14 @@ def with_timeout(default_timeout: int = 300):
         async def wrapper(*args, timeout: int = None, **kwargs):
             actual_timeout = timeout or default_timeout
             try:
-                return await asyncio.wait_for(
-                    func(*args, **kwargs),
-                    timeout=actual_timeout,
-                )
+                if _asyncio_timeout is None:
+                    return await asyncio.wait_for(
+                        func(*args, **kwargs),
+                        timeout=actual_timeout,
+                    )
+                # Runs in the current task; wait_for would schedule another
+                async with _asyncio_timeout(actual_timeout):
+                    return await func(*args, **kwargs)
             except asyncio.TimeoutError:
                 logger.warning(f"[TIMEOUT] {func.__qualname__} exceeded {actual_timeout}s")
                 raise
@@ -91,14 +172,28 @@ def with_timeout(default_timeout: int = 300):
     return decorator
 
 
-def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,)):
+def retry(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    exceptions: tuple = (Exception,),
+    backoff: float = 2.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.1,
+    giveup: Callable[[BaseException], bool] | None = None,
+):
     """
-    Decorator to retry function on failure.
+    Decorator to retry function on failure with exponential backoff.
 
     Args:
         max_attempts: Maximum number of attempts
-        delay: Delay between attempts in seconds
-        exceptions: Tuple of exceptions to catch
+        delay: Delay before the first retry in seconds
+        exceptions: Tuple of exceptions to catch; must not include
+            BaseException (cancellation and interpreter exit always propagate)
+        backoff: Multiplier applied to the delay after each failed attempt
+        max_delay: Upper bound for a single delay in seconds
+        jitter: Relative random spread applied to each delay (0.1 = +/-10%)
+        giveup: Predicate; if it returns True for an exception, re-raise
+            immediately without further attempts
 
     Usage:
         @retry(max_attempts=3, delay=1.0)
@@ -106,6 +201,12 @@ def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Except
             ...
     """
     def decorator(func: F) -> F:
+        # A single attempt needs no retry loop at all
+        if max_attempts <= 1:
+            return func
+
+        func_name = func.__qualname__
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             last_exception = None
@@ -113,16 +214,16 @@ def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Except
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
+                    if isinstance(e, _NEVER_RETRY) or (giveup is not None and giveup(e)):
+                        raise
                     last_exception = e
                     if attempt < max_attempts:
-                        logger.warning(
-                            f"[RETRY] {func.__qualname__} attempt {attempt}/{max_attempts} failed: {e}"
+                        logger.warning(_RETRY_WARN, func_name, attempt, max_attempts, e)
+                        await asyncio.sleep(
+                            _retry_delay(attempt, delay, backoff, max_delay, jitter)
                         )
-                        await asyncio.sleep(delay)
                     else:
-                        logger.error(
-                            f"[RETRY] {func.__qualname__} all {max_attempts} attempts failed"
-                        )
+                        logger.error(_RETRY_FAIL, func_name, max_attempts)
             raise last_exception
 
         @functools.wraps(func)
@@ -132,16 +233,14 @@ def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Except
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
+                    if isinstance(e, _NEVER_RETRY) or (giveup is not None and giveup(e)):
+                        raise
                     last_exception = e
                     if attempt < max_attempts:
-                        logger.warning(
-                            f"[RETRY] {func.__qualname__} attempt {attempt}/{max_attempts} failed: {e}"
-                        )
-                        time.sleep(delay)
+                        logger.warning(_RETRY_WARN, func_name, attempt, max_attempts, e)
+                        time.sleep(_retry_delay(attempt, delay, backoff, max_delay, jitter))
                     else:
-                        logger.error(
-                            f"[RETRY] {func.__qualname__} all {max_attempts} attempts failed"
-                        )
+                        logger.error(_RETRY_FAIL, func_name, max_attempts)
             raise last_exception
 
         if asyncio.iscoroutinefunction(func):
@@ -150,24 +249,64 @@ def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Except
     return decorator
 
 
-def _format_args(args: tuple, kwargs: dict, max_len: int = 50) -> str:
+# Formatted lazily by logging, only if the record is emitted
+_RETRY_WARN = "[RETRY] %s attempt %d/%d failed: %s"
+_RETRY_FAIL = "[RETRY] %s all %d attempts failed"
+
+# Shutdown signals that must never be swallowed, even by a broad `exceptions`
+_NEVER_RETRY = (asyncio.CancelledError, KeyboardInterrupt, SystemExit)
+
+
+def _retry_delay(
+    attempt: int, delay: float, backoff: float, max_delay: float, jitter: float
+) -> float:
+    """Delay before retrying after the given (1-based) failed attempt."""
+    base = min(max_delay, delay * backoff ** (attempt - 1))
+    if jitter:
+        base *= 1 + random.uniform(-jitter, jitter)
+    return max(0.0, base)
+
+
+# Truncates while walking containers, so large arguments are never fully rendered
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxlevel = 2
+_ARG_REPR.maxstring = _ARG_REPR.maxother = 50
+
+
+def _preview(value: Any, max_len: int) -> str:
+    """Render one argument for logging, bounded by max_len."""
+    if isinstance(value, str):
+        s = value
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    else:
+        s = _ARG_REPR.repr(value)
+    if len(s) > max_len:
+        s = s[:max_len] + "..."
+    return s
+
+
+def _takes_self(func: Callable) -> bool:
+    """Whether func's first parameter is self/cls (a method defined in a class body)."""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return next(iter(params), None) in ("self", "cls")
+
+
+def _format_args(args: tuple, kwargs: dict, max_len: int = 50, skip_self: bool = False) -> str:
     """Format function arguments for logging."""
     parts = []
 
-    # Skip 'self' argument
-    display_args = args[1:] if args and hasattr(args[0], "__class__") else args
+    # Skip 'self' argument (decided once at decoration time)
+    display_args = args[1:] if skip_self else args
 
     for arg in display_args:
-        s = str(arg)
-        if len(s) > max_len:
-            s = s[:max_len] + "..."
-        parts.append(s)
+        parts.append(_preview(arg, max_len))
 
     for k, v in kwargs.items():
-        s = str(v)
-        if len(s) > max_len:
-            s = s[:max_len] + "..."
-        parts.append(f"{k}={s}")
+        parts.append(f"{k}={_preview(v, max_len)}")
 
     if not parts:
         return ""
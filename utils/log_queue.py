@@ -0,0 +1,73 @@
+"""
+Log Queue - Move a logger's handler I/O off the calling thread.
+
+Opt-in: the "astrbot" logger belongs to the host application, so its
+handlers are only rewired when the plugin is configured to do so.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger("astrbot")
+
+# Active listener and the handlers it took over, for restoring on uninstall
+_listener: QueueListener | None = None
+_original_handlers: tuple[logging.Handler, ...] = ()
+
+
+def install_queue_logging(target: logging.Logger = logger) -> bool:
+    """
+    Route target's handlers through a QueueHandler/QueueListener pair.
+
+    Callers only enqueue records; the existing handlers run on the
+    listener's background thread. Idempotent.
+
+    Args:
+        target: Logger whose handlers are moved behind the queue
+
+    Returns:
+        True if queued logging is active
+    """
+    global _listener, _original_handlers
+    if _listener is not None:
+        return True
+
+    handlers = tuple(target.handlers)
+    if not handlers:
+        logger.debug("[LogQueue] Logger has no handlers, nothing to queue")
+        return False
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(QueueHandler(log_queue))
+    listener.start()
+
+    _listener = listener
+    _original_handlers = handlers
+    atexit.register(uninstall_queue_logging, target)
+    return True
+
+
+def uninstall_queue_logging(target: logging.Logger = logger) -> None:
+    """Flush queued records and restore target's original handlers."""
+    global _listener, _original_handlers
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in list(target.handlers):
+        if isinstance(handler, QueueHandler):
+            target.removeHandler(handler)
+    for handler in _original_handlers:
+        target.addHandler(handler)
+
+    _listener = None
+    _original_handlers = ()
+    atexit.unregister(uninstall_queue_logging)
+
+
+__all__ = ["install_queue_logging", "uninstall_queue_logging"]
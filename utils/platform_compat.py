@@ -5,23 +5,54 @@ Fixes pgrep compatibility issue in containers and Windows.
 """
 
 import asyncio
+import functools
 import logging
 import os
+import re
 import shutil
 import signal
+import stat
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+# Optional: enumerates processes through the native OS API, without forking
+try:
+    import psutil
+except ImportError:  # pragma: no cover - depends on environment
+    psutil = None
+
 logger = logging.getLogger("astrbot")
 
+# PIDs of processes started by start_background_process, keyed by the caller's
+# key (typically the pattern later passed to is_process_running)
+_managed_pids: dict[str, int] = {}
+
+# Popen handles for processes we started, so they can be polled and reaped
+_procs: dict[int, subprocess.Popen] = {}
+
+# Recent process-table scan results: pattern -> (monotonic time, running),
+# plus the scans currently in flight so concurrent callers share one
+_SCAN_TTL = 1.0
+_SCAN_CACHE_MAX = 64
+_scan_cache: dict[str, tuple[float, bool]] = {}
+_scan_inflight: dict[str, asyncio.Future] = {}
+
+# Seconds to wait after SIGTERM before escalating to SIGKILL, then after SIGKILL
+_TERMINATE_TIMEOUT = 2.0
+_KILL_TIMEOUT = 1.0
+
 
 async def is_process_running(pattern: str) -> bool:
     """
     Check if a process matching pattern is running.
 
-    Cross-platform: Uses tasklist on Windows, pgrep/ps on Unix.
+    Cross-platform: Uses psutil when installed, otherwise tasklist on
+    Windows and pgrep/ps on Unix.
     Container-safe: Falls back to ps if pgrep unavailable.
+    Scan results are cached for _SCAN_TTL seconds, and concurrent callers
+    for the same pattern share a single scan.
 
     Args:
         pattern: Process pattern to search for
@@ -29,15 +60,81 @@ async def is_process_running(pattern: str) -> bool:
     Returns:
         True if process is running
     """
-    if sys.platform == "win32":
-        return await _is_process_running_windows(pattern)
-    else:
-        return await _is_process_running_unix(pattern)
+    # Processes we started are probed by PID; no process table scan needed
+    if is_process_running_fast(pattern):
+        return True
+
+    hit = _scan_cache.get(pattern)
+    if hit is not None and time.monotonic() - hit[0] < _SCAN_TTL:
+        return hit[1]
+
+    task = _scan_inflight.get(pattern)
+    if task is None:
+        task = asyncio.ensure_future(_scan_process_table(pattern))
+        _scan_inflight[pattern] = task
+        task.add_done_callback(lambda _: _scan_inflight.pop(pattern, None))
+    # Shielded so one cancelled caller does not cancel the shared scan
+    return await asyncio.shield(task)
+
+
+async def _scan_process_table(pattern: str) -> bool:
+    """Run the platform process scan and cache its result."""
+    running = None
+    if psutil is not None:
+        running = await asyncio.to_thread(_is_process_running_psutil, pattern)
+    if running is None:
+        if sys.platform == "win32":
+            running = await _is_process_running_windows(pattern)
+        else:
+            running = await _is_process_running_unix(pattern)
+
+    if len(_scan_cache) >= _SCAN_CACHE_MAX:
+        _scan_cache.clear()
+    _scan_cache[pattern] = (time.monotonic(), running)
+    return running
+
+
+def is_process_running_fast(key: str) -> bool:
+    """
+    Check a process started via start_background_process(..., key=key).
+
+    Polls the retained process handle instead of scanning the process
+    table. Unknown keys and exited processes return False.
+
+    Args:
+        key: Key passed to start_background_process
+
+    Returns:
+        True if the registered process is alive
+    """
+    pid = _managed_pids.get(key)
+    if pid is None:
+        return False
+    if _pid_alive(pid):
+        return True
+    _managed_pids.pop(key, None)
+    return False
+
+
+def _pid_alive(pid: int) -> bool:
+    """Poll (and reap) a process we started; False if unknown or exited."""
+    proc = _procs.get(pid)
+    if proc is None:
+        return False
+    if proc.poll() is None:
+        return True
+    del _procs[pid]
+    return False
+
+
+@functools.lru_cache(maxsize=32)
+def _ci_bytes_regex(text: str) -> re.Pattern[bytes]:
+    """Case-insensitive literal matcher for raw (undecoded) command output."""
+    return re.compile(re.escape(text.encode("utf-8")), re.IGNORECASE)
 
 
 async def _is_process_running_windows(pattern: str) -> bool:
     """Check process on Windows using tasklist."""
-    pattern_lower = pattern.lower()
     try:
         proc = await asyncio.create_subprocess_exec(
             "powershell",
@@ -48,8 +145,8 @@ async def _is_process_running_windows(pattern: str) -> bool:
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, _ = await proc.communicate()
-        output = stdout.decode("utf-8", errors="ignore").lower()
-        if pattern_lower in output:
+        # Search the raw bytes; no decode/lower copy of the whole listing
+        if _ci_bytes_regex(pattern).search(stdout) is not None:
             return True
     except FileNotFoundError:
         logger.debug("[PlatformCompat] powershell not available, falling back")
@@ -65,18 +162,23 @@ async def _is_process_running_windows(pattern: str) -> bool:
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, _ = await proc.communicate()
-        output = stdout.decode("utf-8", errors="ignore").lower()
 
         # Check if pattern appears in command line (limited on Windows)
         # This is a best-effort check
-        return pattern_lower.split()[0] in output
+        return _ci_bytes_regex(pattern.split()[0]).search(stdout) is not None
     except Exception as e:
         logger.debug(f"[PlatformCompat] Windows process check failed: {e}")
         return False
 
 
 async def _is_process_running_unix(pattern: str) -> bool:
-    """Check process on Unix using pgrep or ps."""
+    """Check process on Unix: /proc scan on Linux, else pgrep or ps."""
+    if sys.platform.startswith("linux"):
+        # Blocking directory walk; keep it off the event loop
+        running = await asyncio.to_thread(_is_process_running_proc, pattern)
+        if running is not None:
+            return running
+
     # Try pgrep first
     try:
         proc = await asyncio.create_subprocess_exec(
@@ -110,7 +212,85 @@ async def _is_process_running_unix(pattern: str) -> bool:
         return False
 
 
-async def start_background_process(cmd: list[str], cwd: Path) -> int | None:
+def _is_process_running_proc(pattern: str) -> bool | None:
+    """
+    Check process by reading /proc/<pid>/cmdline directly (Linux).
+
+    Avoids forking pgrep/ps. Arguments are joined with spaces before the
+    substring match, as in ps output.
+
+    Returns:
+        True/False, or None if /proc is unavailable
+    """
+    needle = pattern.encode()
+    try:
+        entries = os.scandir("/proc")
+    except OSError as e:
+        logger.debug(f"[PlatformCompat] /proc not readable: {e}")
+        return None
+
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                # Process exited or is not readable
+                continue
+            if needle in cmdline.replace(b"\0", b" "):
+                return True
+    return False
+
+
+def _is_process_running_psutil(pattern: str) -> bool | None:
+    """
+    Check process via psutil's process iterator (blocking; run in a thread).
+
+    Arguments are joined with spaces before the substring match, as in the
+    /proc scan. Matching is case-insensitive on Windows, like tasklist.
+
+    Returns:
+        True/False, or None if the process table could not be enumerated
+    """
+    fold = sys.platform == "win32"
+    needle = pattern.casefold() if fold else pattern
+    try:
+        for proc in psutil.process_iter(["cmdline"]):
+            # None when access to this process was denied
+            cmdline = proc.info["cmdline"]
+            if not cmdline:
+                continue
+            joined = " ".join(cmdline)
+            if needle in (joined.casefold() if fold else joined):
+                return True
+    except Exception as e:
+        logger.debug(f"[PlatformCompat] psutil scan failed: {e}")
+        return None
+    return False
+
+
+# Popen options for detached background processes, fixed per platform.
+# Windows: new process group. Unix: new session; no preexec_fn, so CPython
+# can spawn via vfork/posix_spawn and close inherited fds with close_range.
+if sys.platform == "win32":
+    _BACKGROUND_POPEN_KWARGS: dict = {
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP,
+    }
+else:
+    _BACKGROUND_POPEN_KWARGS = {
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "start_new_session": True,
+    }
+
+
+async def start_background_process(
+    cmd: list[str], cwd: Path, key: str | None = None
+) -> int | None:
     """
     Start a background process.
 
@@ -119,31 +299,27 @@ async def start_background_process(cmd: list[str], cwd: Path) -> int | None:
     Args:
         cmd: Command and arguments
         cwd: Working directory
+        key: Optional key to register the PID under for is_process_running_fast
 
     Returns:
         Process ID if started, None on failure
     """
     try:
-        if sys.platform == "win32":
-            # Windows: Use CREATE_NEW_PROCESS_GROUP
-            proc = subprocess.Popen(
-                cmd,
-                cwd=str(cwd),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-            )
-        else:
-            # Unix: Use start_new_session
-            proc = subprocess.Popen(
-                cmd,
-                cwd=str(cwd),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-            )
+        # Spawned in a worker thread so fork/CreateProcess never blocks the
+        # loop; a Popen handle (unlike an asyncio Process) is not tied to the
+        # loop, so it can be polled and reaped from any context
+        proc = await asyncio.to_thread(
+            subprocess.Popen, cmd, cwd=cwd, **_BACKGROUND_POPEN_KWARGS
+        )
 
         logger.debug(f"[PlatformCompat] Started background process: pid={proc.pid}")
+        # Drop handles of processes that have since exited
+        for pid in [pid for pid, p in _procs.items() if p.poll() is not None]:
+            del _procs[pid]
+        _procs[proc.pid] = proc
+        if key is not None:
+            _managed_pids[key] = proc.pid
+            _scan_cache.pop(key, None)
         return proc.pid
 
     except Exception as e:
@@ -151,45 +327,176 @@ async def start_background_process(cmd: list[str], cwd: Path) -> int | None:
         return None
 
 
-def terminate_process(pid: int) -> bool:
+async def terminate_process(pid: int) -> bool:
     """
     Terminate a process by PID (cross-platform).
 
+    Processes started by start_background_process are waited for, and
+    killed if they ignore SIGTERM for _TERMINATE_TIMEOUT seconds. The
+    signalling and waiting run in a worker thread.
+
     Args:
         pid: Process ID to terminate
 
     Returns:
         True if termination command succeeded
     """
+    # Registry updates stay on the loop thread; only the blocking part moves
+    for key in [k for k, v in _managed_pids.items() if v == pid]:
+        del _managed_pids[key]
+        _scan_cache.pop(key, None)
+    proc = _procs.pop(pid, None)
+    return await asyncio.to_thread(_terminate_process_sync, pid, proc)
+
+
+def _terminate_process_sync(pid: int, proc: subprocess.Popen | None) -> bool:
+    """Signal pid and wait for it to exit, escalating to kill if needed."""
     try:
         if sys.platform == "win32":
-            result = subprocess.run(
-                ["taskkill", "/PID", str(pid), "/T", "/F"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False,
-            )
-            return result.returncode == 0
-        os.kill(pid, signal.SIGTERM)
+            terminated = _terminate_tree_windows(pid)
+            if terminated and proc is not None:
+                try:
+                    proc.wait(timeout=_KILL_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    # TerminateProcess succeeded; the exit is just not reaped yet
+                    logger.warning(f"[PlatformCompat] pid={pid} killed, exit not yet observed")
+            return terminated
+        if proc is None:
+            os.kill(pid, signal.SIGTERM)
+            return True
+
+        proc.terminate()
+        try:
+            proc.wait(timeout=_TERMINATE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.debug(f"[PlatformCompat] pid={pid} ignored SIGTERM, killing")
+            proc.kill()
+            proc.wait(timeout=_KILL_TIMEOUT)
         return True
     except Exception as e:
         logger.warning(f"[PlatformCompat] Failed to terminate pid={pid}: {e}")
         return False
 
 
+def _terminate_tree_windows(pid: int) -> bool:
+    """
+    Forcefully terminate pid and its descendants via the Win32 API.
+
+    Same semantics as ``taskkill /PID pid /T /F`` without spawning taskkill:
+    one process snapshot to find descendants, then TerminateProcess on each.
+
+    Returns:
+        True if pid itself was terminated
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    th32cs_snapprocess = 0x00000002
+    process_terminate = 0x0001
+    invalid_handle = wintypes.HANDLE(-1).value
+
+    # Parent -> children map from a single snapshot
+    children: dict[int, list[int]] = {}
+    snapshot = kernel32.CreateToolhelp32Snapshot(th32cs_snapprocess, 0)
+    if snapshot and snapshot != invalid_handle:
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while ok:
+                children.setdefault(entry.th32ParentProcessID, []).append(entry.th32ProcessID)
+                ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(snapshot)
+
+    # Descendants first, then the root
+    tree = [pid]
+    for parent in tree:
+        tree.extend(c for c in children.get(parent, ()) if c not in tree)
+
+    terminated = False
+    for target in reversed(tree):
+        handle = kernel32.OpenProcess(process_terminate, False, target)
+        if not handle:
+            continue
+        try:
+            if kernel32.TerminateProcess(handle, 1) and target == pid:
+                terminated = True
+        finally:
+            kernel32.CloseHandle(handle)
+    return terminated
+
+
+# Successful shutil.which lookups keyed on (command, PATH, PATHEXT). Misses are
+# not cached so a CLI installed later in the process is still found.
+_WHICH_CACHE: dict[tuple[str, str, str], str] = {}
+_WHICH_CACHE_MAX = 64
+
+
 def resolve_command(command: str) -> str:
     """
     Resolve command path using PATH (cross-platform).
 
     On Windows, this resolves .cmd/.exe paths so subprocess can execute.
+    Results are cached until PATH or PATHEXT changes.
+    """
+    environ = os.environ
+    key = (command, environ.get("PATH", ""), environ.get("PATHEXT", ""))
+    resolved = _WHICH_CACHE.get(key)
+    if resolved is None:
+        resolved = shutil.which(command)
+        if resolved is None:
+            return command
+        if len(_WHICH_CACHE) >= _WHICH_CACHE_MAX:
+            _WHICH_CACHE.clear()
+        _WHICH_CACHE[key] = resolved
+    return resolved
+
+
+def ensure_dir(path: Path) -> None:
+    """
+    Create directory if missing.
+
+    Fast path: a single stat() when the directory already exists, instead of
+    mkdir(parents=True) walking the path and failing with EEXIST.
     """
-    resolved = shutil.which(command)
-    return resolved or command
+    try:
+        if stat.S_ISDIR(os.stat(path).st_mode):
+            return
+    except FileNotFoundError:
+        pass
+    path.mkdir(parents=True, exist_ok=True)
 
 
 __all__ = [
     "is_process_running",
+    "is_process_running_fast",
     "start_background_process",
     "terminate_process",
     "resolve_command",
+    "ensure_dir",
 ]
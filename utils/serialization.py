@@ -0,0 +1,24 @@
+"""
+Serialization - JSON decoding with optional orjson acceleration.
+
+orjson is an optional extra; the stdlib json module is used when it is not
+installed. orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+catch a single exception type either way.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+JSONDecodeError = json.JSONDecodeError
+
+# Accepts str or bytes; returns plain Python objects in both implementations
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+__all__ = ["HAS_ORJSON", "JSONDecodeError", "json_loads"]